@@ -11,20 +11,21 @@ from datetime import datetime
 # Add src directory to path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
-from scraper import MahkamahAgungScraper
-
 def main():
     parser = argparse.ArgumentParser(description='Scraper Mahkamah Agung RI')
     parser.add_argument('--pages', type=int, default=5, help='Number of pages to scrape')
     parser.add_argument('--start-page', type=int, default=1, help='Starting page number')
     parser.add_argument('--debug', action='store_true', help='Enable debug mode')
-    parser.add_argument('--format', choices=['json', 'csv', 'excel'], default='json', help='Output format')
+    parser.add_argument('--format', choices=['json', 'csv', 'excel', 'parquet'], default='json', help='Output format')
     parser.add_argument('--output', type=str, help='Output filename (without extension)')
     parser.add_argument('--test-only', action='store_true', help='Test connectivity only')
     parser.add_argument('--resume', action='store_true', help='Resume from checkpoint')
     
     args = parser.parse_args()
     
+    # Imported after argument parsing so --help and bad arguments stay fast
+    from scraper import MahkamahAgungScraper
+    
     print("🏛️  Scraper Mahkamah Agung RI")
     print("=" * 50)
     print(f"Debug mode: {'ON' if args.debug else 'OFF'}")
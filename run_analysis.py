@@ -7,8 +7,6 @@ import sys
 import os
 sys.path.append('src')
 
-from html_structure_analyzer import analyze_saved_html_files, print_analysis_summary, save_analysis_report
-
 def main():
     print("🔍 Mahkamah Agung HTML Structure Analyzer")
     print("=" * 50)
@@ -34,12 +32,18 @@ def main():
         print("Please run the scraper with --debug flag first to generate HTML files")
         return
     
+    # Imported only once there is something to analyze
+    from html_structure_analyzer import (
+        analyze_saved_html_files, print_analysis_summary, save_analysis_report, summarize_analysis
+    )
+    
     # Run analysis
     results = analyze_saved_html_files(html_dir)
     
     if results:
-        print_analysis_summary(results)
-        report = save_analysis_report(results)
+        summary = summarize_analysis(results)
+        print_analysis_summary(results, summary)
+        report = save_analysis_report(results, summary=summary)
         
         if report:
             print(f"\n✅ Analysis completed successfully!")
@@ -17,8 +17,25 @@ LOG_DIR = "logs"
 # Scraping Configuration
 DEFAULT_TIMEOUT = 30
 MAX_RETRIES = 3
-DELAY_RANGE = (1, 3)  # Random delay between requests
+REQUESTS_PER_SECOND = 0.5  # Request rate shared by all fetch threads (the old 1-3 s delay pace)
+REQUEST_JITTER = 0.2  # Extra random delay per request (seconds)
 RATE_LIMIT_DELAY_RANGE = (2, 5)  # Delay when rate limited
+RATE_LIMIT_CAP = 60  # Upper bound for a single rate limit backoff (seconds)
+RATE_LIMIT_MIN_RATE = 0.25  # Requests per second never drops below this after repeated 429s
+RATE_RECOVERY_STREAK = 50  # Successful requests before a lowered rate is doubled again
+PAGE_FETCH_WORKERS = 5  # Listing pages fetched concurrently per batch
+DOWNLOAD_WORKERS = 4  # Putusan whose files are downloaded concurrently
+MAX_PAGE_SIZE = 20 * 1024 * 1024  # Larger HTML responses are skipped (bytes)
+PAGE_CACHE_SIZE = 16  # Recently fetched pages kept in memory (0 disables the cache)
+ANALYSIS_CACHE_SIZE = 64  # HTML structure analyses kept per distinct page body (0 disables the cache)
+DNS_CACHE_TTL = 0  # Seconds to reuse the resolved BASE_URL address (opt-in; 0 disables the cache)
+HTTP_CACHE_DIR = os.path.join(DATA_DIR, "http_cache")  # On-disk page cache, used with --cache
+HTTP_CACHE_TTL = 24 * 3600  # Seconds a page in the on-disk cache is reused
+
+# Connection pooling (all requests go to a single host, so POOL_MAXSIZE is
+# the number of keep-alive connections that can be reused)
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 64
 
 # User Agents
 USER_AGENTS = [
@@ -34,7 +51,15 @@ SELENIUM_CONFIG = {
     "headless": True,
     "window_size": (1920, 1080),
     "page_load_timeout": 30,
-    "implicit_wait": 10
+    "implicit_wait": 10,
+    "max_pages_per_driver": 200,  # Restart Chrome after this many pages to bound memory
+    "pool_size": 4,  # Chrome instances the fetch threads can use at once
+    # Resources the parser never uses, blocked to speed up page loads
+    "blocked_urls": [
+        "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.ico",
+        "*.css", "*.woff", "*.woff2", "*.ttf",
+        "*google-analytics.com/*", "*googletagmanager.com/*"
+    ]
 }
 
 # Data Validation
@@ -42,9 +67,12 @@ REQUIRED_FIELDS = ["nomor", "tanggal", "jenis"]
 OPTIONAL_FIELDS = ["link", "scraped_at", "additional_data"]
 
 # Export Configuration
-EXPORT_FORMATS = ["csv", "json", "excel"]
+EXPORT_FORMATS = ["csv", "json", "excel", "parquet"]
 CSV_ENCODING = "utf-8"
+PARQUET_COMPRESSION = "zstd"
+EXPORT_BATCH_SIZE = 10000  # Records converted per batch when streaming CSV/Parquet with pyarrow
 JSON_INDENT = 2
+WRITE_BUFFER_SIZE = 1 << 20  # 1 MiB buffer for large HTML/JSON dumps
 
 # Logging Configuration
 LOG_LEVEL = "INFO"
@@ -5,9 +5,66 @@ Debugging tools for web scraping - inspect websites and test selectors
 import requests
 import json
 import os
+import random
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
+from collections import Counter
+
+from config import (
+    USER_AGENTS, DEFAULT_TIMEOUT, MAX_RETRIES, WRITE_BUFFER_SIZE, POOL_CONNECTIONS, POOL_MAXSIZE
+)
+
+# Containers previewed by inspect_website (first 3 of each)
+PREVIEW_CONTAINERS = {
+    'table': 'Tables',
+    'ul': 'Lists (ul)',
+    'ol': 'Lists (ol)',
+    'article': 'Articles',
+    'section': 'Sections',
+}
+
+# AJAX/JavaScript indicators looked for in the raw page bytes
+JS_INDICATORS = ['ajax', 'fetch', 'xmlhttprequest', 'api', 'json', 'async', 'spa']
+
+_SESSION = None
+
+
+def get_session() -> requests.Session:
+    """Shared keep-alive session so repeated inspections reuse connections"""
+    global _SESSION
+    
+    if _SESSION is None:
+        _SESSION = requests.Session()
+        
+        retry_strategy = Retry(
+            total=MAX_RETRIES,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["HEAD", "GET", "OPTIONS"],
+            backoff_factor=0.3
+        )
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE
+        )
+        _SESSION.mount("http://", adapter)
+        _SESSION.mount("https://", adapter)
+        _SESSION.headers.update({'User-Agent': random.choice(USER_AGENTS)})
+    
+    return _SESSION
+
+
+def close_session():
+    """Close the shared session"""
+    global _SESSION
+    
+    if _SESSION is not None:
+        _SESSION.close()
+        _SESSION = None
+
 
 def inspect_website(url: str):
     """
@@ -18,7 +75,7 @@ def inspect_website(url: str):
     
     try:
         # Make request
-        response = requests.get(url, timeout=30)
+        response = get_session().get(url, timeout=DEFAULT_TIMEOUT)
         
         print(f"📊 Response Info:")
         print(f"  Status: {response.status_code}")
@@ -29,53 +86,40 @@ def inspect_website(url: str):
         if response.history:
             print(f"  Redirects: {len(response.history)}")
         
-        # Parse HTML
+        # Parse HTML once and tally tags/classes in a single pass over it
         soup = BeautifulSoup(response.text, 'lxml')
+        elements = soup.find_all()
+        tag_counts = Counter(elem.name for elem in elements)
+        class_counts = Counter(cls for elem in elements for cls in elem.get('class', []))
         
         print(f"\n🏗️  HTML Structure:")
         print(f"  Title: {soup.title.string if soup.title else 'No title'}")
-        print(f"  Total elements: {len(soup.find_all())}")
-        print(f"  Tables: {len(soup.find_all('table'))}")
-        print(f"  Forms: {len(soup.find_all('form'))}")
-        print(f"  Links: {len(soup.find_all('a'))}")
-        print(f"  Scripts: {len(soup.find_all('script'))}")
+        print(f"  Total elements: {len(elements)}")
+        print(f"  Tables: {tag_counts['table']}")
+        print(f"  Forms: {tag_counts['form']}")
+        print(f"  Links: {tag_counts['a']}")
+        print(f"  Scripts: {tag_counts['script']}")
         
         # Check for potential data containers
         print(f"\n📦 Potential Data Containers:")
-        containers = [
-            ('Tables', soup.find_all('table')),
-            ('Lists (ul)', soup.find_all('ul')),
-            ('Lists (ol)', soup.find_all('ol')),
-            ('Articles', soup.find_all('article')),
-            ('Sections', soup.find_all('section')),
-        ]
-        
-        for name, elements in containers:
-            if elements:
-                print(f"  {name}: {len(elements)} found")
-                for i, elem in enumerate(elements[:3]):
+        for tag, name in PREVIEW_CONTAINERS.items():
+            if tag_counts[tag]:
+                print(f"  {name}: {tag_counts[tag]} found")
+                for i, elem in enumerate(soup.find_all(tag, limit=3)):
                     preview = elem.get_text(strip=True)[:100]
                     print(f"    {i+1}. {preview}...")
         
         # Check for common class patterns
         print(f"\n🎨 Common CSS Classes:")
-        all_classes = []
-        for elem in soup.find_all(class_=True):
-            all_classes.extend(elem.get('class', []))
-        
-        class_counts = {}
-        for cls in all_classes:
-            class_counts[cls] = class_counts.get(cls, 0) + 1
         
         # Show top 10 most common classes
-        for cls, count in sorted(class_counts.items(), key=lambda x: x[1], reverse=True)[:10]:
+        for cls, count in class_counts.most_common(10):
             print(f"  .{cls}: {count} elements")
         
         # Check for AJAX/JavaScript indicators
         print(f"\n⚡ Dynamic Content Indicators:")
-        page_text = response.text.lower()
-        js_indicators = ['ajax', 'fetch', 'xmlhttprequest', 'api', 'json', 'async', 'spa']
-        found_indicators = [indicator for indicator in js_indicators if indicator in page_text]
+        page_bytes = response.content.lower()
+        found_indicators = [indicator for indicator in JS_INDICATORS if indicator.encode() in page_bytes]
         
         if found_indicators:
             print(f"  Found: {', '.join(found_indicators)}")
@@ -83,8 +127,8 @@ def inspect_website(url: str):
             print("  No common AJAX indicators found")
         
         # Save for manual inspection
-        with open('debug_page.html', 'w', encoding='utf-8') as f:
-            f.write(response.text)
+        with open('debug_page.html', 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(response.content)
         print(f"\n💾 Full HTML saved to: debug_page.html")
         
         return soup
@@ -98,12 +142,13 @@ def test_selectors(html_file: str = None, url: str = None):
     Interactive selector testing tool
     """
     if html_file and os.path.exists(html_file):
-        with open(html_file, 'r', encoding='utf-8') as f:
+        # Raw bytes: lxml detects the encoding itself, without a Python decode
+        with open(html_file, 'rb') as f:
             html_content = f.read()
         print(f"📄 Loaded HTML from: {html_file}")
     elif url:
-        response = requests.get(url)
-        html_content = response.text
+        response = get_session().get(url, timeout=DEFAULT_TIMEOUT)
+        html_content = response.content
         print(f"🌐 Loaded HTML from: {url}")
     else:
         print("❌ Please provide either html_file or url parameter")
@@ -220,10 +265,10 @@ if __name__ == "__main__":
     elif command == "selectors":
         # Auto-generate and test selectors
         if target.startswith('http'):
-            response = requests.get(target)
-            soup = BeautifulSoup(response.text, 'lxml')
+            response = get_session().get(target, timeout=DEFAULT_TIMEOUT)
+            soup = BeautifulSoup(response.content, 'lxml')
         else:
-            with open(target, 'r', encoding='utf-8') as f:
+            with open(target, 'rb') as f:
                 soup = BeautifulSoup(f.read(), 'lxml')
         
         selectors = generate_test_selectors(soup)
@@ -235,3 +280,5 @@ if __name__ == "__main__":
                 print(f"✅ {selector}: {len(elements)} elements")
             else:
                 print(f"❌ {selector}: No elements")
+    
+    close_session()
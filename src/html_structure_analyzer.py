@@ -4,46 +4,157 @@ Analyzes saved HTML files to understand the actual structure
 """
 
 import os
-import json
-from bs4 import BeautifulSoup
-from typing import Dict, List
+from collections import defaultdict
+from datetime import datetime, timezone
+from lxml import etree, html as lxml_html
+from lxml.cssselect import CSSSelector
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Union
 import re
 
+from utils import write_json
 
-def analyze_saved_html_files(html_dir: str = "logs/html_debug") -> Dict:
-    """Analyze all saved HTML files to understand structure"""
+
+# Patterns used by analyze_putusan_element
+DATE_PATTERN = re.compile(r'\d{1,2}[-/]\d{1,2}[-/]\d{2,4}|\d{1,2}\s+\w+\s+\d{4}')
+
+CASE_NUMBER_PATTERN = re.compile(r'\d+\s*[/K]\s*[A-Z]+[./]\w*[/]\d{4}', re.I)
+
+NUMBER_PATTERN = re.compile(
+    r'(?P<case>\d+\s*[/K]\s*[A-Z]+[./]\w*[/]\d{4})|Nomor\s+(?P<nomor>[^<\n]+)',
+    re.I
+)
+
+# Parser shared by every file analyzed in this process, so libxml2's
+# dictionary of interned tag/attribute names is reused across documents
+HTML_PARSER = lxml_html.HTMLParser(recover=True, remove_comments=True)
+
+# Files at least this large are read by libxml2 directly instead of
+# being read into one bytes object first
+LARGE_FILE_SIZE = 64 * 1024
+
+
+def _compile_selectors(selectors: List[str]) -> List[tuple]:
+    """Pair each CSS selector with its compiled matcher"""
+    return [(selector, CSSSelector(selector)) for selector in selectors]
+
+
+# Selectors used by analyze_single_html, compiled once at import time.
+# Putusan selectors are fallbacks, each broader than the one before it;
+# '#popular-post-list-sidebar div.spost' is left out as it can only match
+# when 'div.spost' already did.
+PUTUSAN_SELECTORS = _compile_selectors([
+    'div.spost',
+    '.spost.clearfix',
+    'div[class*="spost"]'
+])
+
+DOWNLOAD_SELECTORS = _compile_selectors([
+    'a[href*=".pdf"]',
+    'a[href*=".zip"]',
+    'a[href*="download"]',
+    'a[href*="direktori/putusan/"]'
+])
+
+NAV_SELECTORS = _compile_selectors([
+    '.pagination',
+    'nav',
+    'a[href*="page="]',
+    'button[onclick*="page"]'
+])
+
+
+def _get_text(element, strip: bool = False) -> str:
+    """lxml equivalent of BeautifulSoup's get_text()"""
+    if strip:
+        return ''.join(text.strip() for text in element.itertext())
+    return element.text_content()
+
+
+def _parse_html_file(filepath: str, parser: lxml_html.HTMLParser):
+    """Parse an HTML file into an lxml tree"""
+    # Raw bytes: lxml detects the charset from the document's meta tag
+    if os.path.getsize(filepath) < LARGE_FILE_SIZE:
+        with open(filepath, 'rb') as f:
+            return lxml_html.document_fromstring(f.read(), parser=parser)
+    
+    # libxml2 reads the file itself, so no Python copy of it is made, and
+    # unlike feed() a failed parse doesn't leave the shared parser mid-document
+    tree = lxml_html.parse(filepath, parser=parser).getroot()
+    if tree is None:
+        raise etree.ParserError("Document is empty")
+    return tree
+
+
+def _analyze_file(filepath: str) -> Dict:
+    """Read and analyze one HTML file (process pool worker)"""
+    tree = _parse_html_file(filepath, HTML_PARSER)
+    return analyze_html_tree(tree, os.path.basename(filepath))
+
+
+def analyze_saved_html_files(html_dir: str = "logs/html_debug", max_workers: Optional[int] = None) -> Dict:
+    """Analyze all saved HTML files to understand structure
+    
+    Files are analyzed in parallel processes; pass max_workers=1 to analyze
+    them sequentially in the current process.
+    """
     
     if not os.path.exists(html_dir):
         print(f"❌ HTML debug directory not found: {html_dir}")
         return {}
     
     analysis_results = {}
+    with os.scandir(html_dir) as entries:
+        html_files = {
+            entry.name: entry.path for entry in entries
+            if entry.name.endswith('.html') and entry.is_file()
+        }
+    
+    if max_workers == 1 or len(html_files) < 2:
+        for filename, filepath in html_files.items():
+            print(f"🔍 Analyzing: {filename}")
+            
+            try:
+                analysis_results[filename] = _analyze_file(filepath)
+            except Exception as e:
+                print(f"❌ Error analyzing {filename}: {e}")
+        
+        return analysis_results
     
-    for filename in os.listdir(html_dir):
-        if filename.endswith('.html'):
-            filepath = os.path.join(html_dir, filename)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            filename: executor.submit(_analyze_file, filepath)
+            for filename, filepath in html_files.items()
+        }
+        
+        for filename, future in futures.items():
             print(f"🔍 Analyzing: {filename}")
             
             try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    html_content = f.read()
-                
-                analysis = analyze_single_html(html_content, filename)
-                analysis_results[filename] = analysis
-                
+                analysis_results[filename] = future.result()
             except Exception as e:
                 print(f"❌ Error analyzing {filename}: {e}")
     
     return analysis_results
 
 
-def analyze_single_html(html_content: str, filename: str) -> Dict:
+def analyze_single_html(html_content: Union[str, bytes], filename: str,
+                        parser: Optional[lxml_html.HTMLParser] = None) -> Dict:
     """Analyze a single HTML file"""
-    soup = BeautifulSoup(html_content, 'lxml')
+    tree = lxml_html.document_fromstring(html_content, parser=parser)
+    return analyze_html_tree(tree, filename)
+
+
+def analyze_html_tree(tree, filename: str) -> Dict:
+    """Analyze an already parsed lxml document"""
+    # Bucket every element by tag in a single traversal
+    elements_by_tag = defaultdict(list)
+    for element in tree.iter(etree.Element):
+        elements_by_tag[element.tag].append(element)
     
     analysis = {
         'filename': filename,
-        'total_elements': len(soup.find_all()),
+        'total_elements': sum(len(elements) for elements in elements_by_tag.values()),
         'structure': {},
         'putusan_elements': [],
         'download_links': [],
@@ -52,42 +163,30 @@ def analyze_single_html(html_content: str, filename: str) -> Dict:
     }
     
     # Basic structure
+    title = elements_by_tag['title']
     analysis['structure'] = {
-        'title': soup.title.string if soup.title else 'No title',
-        'tables': len(soup.find_all('table')),
-        'divs': len(soup.find_all('div')),
-        'forms': len(soup.find_all('form')),
-        'links': len(soup.find_all('a')),
-        'scripts': len(soup.find_all('script'))
+        'title': title[0].text if title else 'No title',
+        'tables': len(elements_by_tag['table']),
+        'divs': len(elements_by_tag['div']),
+        'forms': len(elements_by_tag['form']),
+        'links': len(elements_by_tag['a']),
+        'scripts': len(elements_by_tag['script'])
     }
     
-    # Look for putusan elements based on the HTML structure
-    putusan_selectors = [
-        'div.spost',
-        '#popular-post-list-sidebar div.spost',
-        '.spost clearfix',
-        'div[class*="spost"]'
-    ]
-    
-    for selector in putusan_selectors:
-        elements = soup.select(selector)
+    # Look for putusan elements based on the HTML structure (first match wins)
+    for selector, matcher in PUTUSAN_SELECTORS:
+        elements = matcher(tree)
         if elements:
             analysis['putusan_elements'].append({
                 'selector': selector,
                 'count': len(elements),
                 'sample_data': analyze_putusan_element(elements[0]) if elements else None
             })
+            break
     
     # Look for download links
-    download_selectors = [
-        'a[href*=".pdf"]',
-        'a[href*=".zip"]',
-        'a[href*="download"]',
-        'a[href*="direktori/putusan/"]'
-    ]
-    
-    for selector in download_selectors:
-        links = soup.select(selector)
+    for selector, matcher in DOWNLOAD_SELECTORS:
+        links = matcher(tree)
         if links:
             analysis['download_links'].append({
                 'selector': selector,
@@ -96,32 +195,25 @@ def analyze_single_html(html_content: str, filename: str) -> Dict:
             })
     
     # Analyze forms
-    forms = soup.find_all('form')
+    forms = elements_by_tag['form']
     for i, form in enumerate(forms):
         analysis['forms'].append({
             'index': i,
             'action': form.get('action', ''),
             'method': form.get('method', ''),
-            'inputs': len(form.find_all('input')),
+            'inputs': len(form.findall('.//input')),
             'id': form.get('id', ''),
-            'class': form.get('class', [])
+            'class': form.get('class', '').split()
         })
     
     # Look for navigation elements
-    nav_selectors = [
-        '.pagination',
-        'nav',
-        'a[href*="page="]',
-        'button[onclick*="page"]'
-    ]
-    
-    for selector in nav_selectors:
-        nav_elements = soup.select(selector)
+    for selector, matcher in NAV_SELECTORS:
+        nav_elements = matcher(tree)
         if nav_elements:
             analysis['navigation'].append({
                 'selector': selector,
                 'count': len(nav_elements),
-                'sample_text': nav_elements[0].get_text(strip=True)[:100] if nav_elements else ''
+                'sample_text': _get_text(nav_elements[0], strip=True)[:100] if nav_elements else ''
             })
     
     return analysis
@@ -129,133 +221,140 @@ def analyze_single_html(html_content: str, filename: str) -> Dict:
 
 def analyze_putusan_element(element) -> Dict:
     """Analyze a single putusan element to understand its structure"""
-    if not element:
+    if element is None:
         return {}
     
     structure = {
-        'tag': element.name,
-        'classes': element.get('class', []),
+        'tag': element.tag,
+        'classes': element.get('class', '').split(),
         'id': element.get('id', ''),
         'children': [],
-        'text_content': element.get_text(strip=True)[:200],
+        'text_content': _get_text(element, strip=True)[:200],
         'links': [],
         'dates': [],
         'numbers': []
     }
     
     # Analyze child elements
-    for child in element.children:
-        if hasattr(child, 'name') and child.name:
-            child_info = {
-                'tag': child.name,
-                'classes': child.get('class', []),
-                'id': child.get('id', ''),
-                'text': child.get_text(strip=True)[:100]
-            }
-            structure['children'].append(child_info)
+    for child in element.iterchildren(etree.Element):
+        child_info = {
+            'tag': child.tag,
+            'classes': child.get('class', '').split(),
+            'id': child.get('id', ''),
+            'text': _get_text(child, strip=True)[:100]
+        }
+        structure['children'].append(child_info)
     
     # Find links
-    links = element.find_all('a', href=True)
+    links = element.iterfind('.//a[@href]')
     for link in links:
         structure['links'].append({
-            'href': link['href'],
-            'text': link.get_text(strip=True),
+            'href': link.get('href'),
+            'text': _get_text(link, strip=True),
             'title': link.get('title', '')
         })
     
     # Extract dates
-    text = element.get_text()
-    date_patterns = [
-        r'\d{1,2}[-/]\d{1,2}[-/]\d{2,4}',
-        r'\d{1,2}\s+\w+\s+\d{4}'
-    ]
-    
-    for pattern in date_patterns:
-        matches = re.findall(pattern, text)
-        structure['dates'].extend(matches)
-    
-    # Extract numbers (like case numbers)
-    number_patterns = [
-        r'\d+\s*[/K]\s*[A-Z]+[./]\w*[/]\d{4}',
-        r'Nomor\s+([^<\n]+)'
-    ]
-    
-    for pattern in number_patterns:
-        matches = re.findall(pattern, text, re.I)
-        structure['numbers'].extend(matches)
+    text = _get_text(element)
+    structure['dates'] = DATE_PATTERN.findall(text)
+    
+    # Extract numbers (like case numbers), case numbers first then "Nomor ..." texts
+    nomor_texts = []
+    for match in NUMBER_PATTERN.finditer(text):
+        if match.group('case'):
+            structure['numbers'].append(match.group('case'))
+        else:
+            # A case number inside the "Nomor ..." text is consumed by this match
+            nomor_texts.append(match.group('nomor'))
+            structure['numbers'].extend(CASE_NUMBER_PATTERN.findall(match.group('nomor')))
+    structure['numbers'].extend(nomor_texts)
     
     return structure
 
 
-def generate_selectors_from_analysis(analysis_results: Dict) -> List[str]:
-    """Generate optimized selectors based on analysis"""
-    selectors = []
-    
-    # Collect all successful putusan selectors
-    for filename, analysis in analysis_results.items():
-        for putusan_info in analysis.get('putusan_elements', []):
-            if putusan_info['count'] > 0:
-                selectors.append(putusan_info['selector'])
-    
-    # Remove duplicates and sort by preference
-    unique_selectors = list(set(selectors))
-    
-    # Preferred order
-    preference_order = [
-        'div.spost',
-        '#popular-post-list-sidebar div.spost',
-        '.spost',
-        'div[class*="spost"]'
-    ]
+# Preferred order for recommended putusan selectors
+SELECTOR_PREFERENCE_ORDER = [
+    'div.spost',
+    '#popular-post-list-sidebar div.spost',
+    '.spost.clearfix',
+    'div[class*="spost"]'
+]
+
+
+def _order_selectors(unique_selectors: set) -> List[str]:
+    """Order selectors by preference, remaining ones sorted after"""
+    unique_selectors = set(unique_selectors)
     
     ordered_selectors = []
-    for preferred in preference_order:
+    for preferred in SELECTOR_PREFERENCE_ORDER:
         if preferred in unique_selectors:
             ordered_selectors.append(preferred)
-            unique_selectors.remove(preferred)
+            unique_selectors.discard(preferred)
     
     # Add remaining selectors
-    ordered_selectors.extend(unique_selectors)
+    ordered_selectors.extend(sorted(unique_selectors))
     
     return ordered_selectors
 
 
-def save_analysis_report(analysis_results: Dict, output_file: str = "html_analysis_report.json"):
-    """Save detailed analysis report"""
-    try:
-        # Generate summary
-        summary = {
-            'total_files_analyzed': len(analysis_results),
-            'files_with_putusan_data': 0,
-            'common_selectors': [],
-            'download_link_patterns': [],
-            'recommended_parsing_strategy': {}
-        }
-        
-        # Count files with putusan data
-        for analysis in analysis_results.values():
-            if analysis.get('putusan_elements'):
-                summary['files_with_putusan_data'] += 1
+def generate_selectors_from_analysis(analysis_results: Dict) -> List[str]:
+    """Generate optimized selectors based on analysis"""
+    # Collect all successful putusan selectors (deduplicated)
+    unique_selectors = set()
+    for filename, analysis in analysis_results.items():
+        for putusan_info in analysis.get('putusan_elements', []):
+            if putusan_info['count'] > 0:
+                unique_selectors.add(putusan_info['selector'])
+    
+    return _order_selectors(unique_selectors)
+
+
+def summarize_analysis(analysis_results: Dict) -> Dict:
+    """Build the report summary in a single pass over the analysis results"""
+    files_with_putusan_data = 0
+    unique_selectors = set()
+    download_patterns = set()
+    
+    for analysis in analysis_results.values():
+        putusan_elements = analysis.get('putusan_elements', [])
+        if putusan_elements:
+            files_with_putusan_data += 1
         
-        # Generate recommended selectors
-        summary['common_selectors'] = generate_selectors_from_analysis(analysis_results)
+        for putusan_info in putusan_elements:
+            if putusan_info['count'] > 0:
+                unique_selectors.add(putusan_info['selector'])
         
-        # Compile download patterns
-        download_patterns = set()
-        for analysis in analysis_results.values():
-            for download_info in analysis.get('download_links', []):
-                download_patterns.add(download_info['selector'])
-        summary['download_link_patterns'] = list(download_patterns)
+        for download_info in analysis.get('download_links', []):
+            download_patterns.add(download_info['selector'])
+    
+    return {
+        'total_files_analyzed': len(analysis_results),
+        'files_with_putusan_data': files_with_putusan_data,
+        'common_selectors': _order_selectors(unique_selectors),
+        'download_link_patterns': list(download_patterns),
+        'recommended_parsing_strategy': {}
+    }
+
+
+def save_analysis_report(analysis_results: Dict, output_file: str = "html_analysis_report.json",
+                         summary: Optional[Dict] = None):
+    """Save detailed analysis report
+    
+    Pass the result of summarize_analysis() as summary to reuse it instead of
+    recomputing it.
+    """
+    try:
+        if summary is None:
+            summary = summarize_analysis(analysis_results)
         
         # Create full report
         report = {
             'summary': summary,
             'detailed_analysis': analysis_results,
-            'generated_at': str(datetime.now())
+            'generated_at': datetime.now(timezone.utc).isoformat(timespec='seconds')
         }
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        write_json(output_file, report)
         
         print(f"📊 Analysis report saved to: {output_file}")
         return report
@@ -265,7 +364,7 @@ def save_analysis_report(analysis_results: Dict, output_file: str = "html_analys
         return None
 
 
-def print_analysis_summary(analysis_results: Dict):
+def print_analysis_summary(analysis_results: Dict, summary: Optional[Dict] = None):
     """Print a summary of the analysis"""
     print("\n" + "="*60)
     print("📊 HTML STRUCTURE ANALYSIS SUMMARY")
@@ -291,14 +390,16 @@ def print_analysis_summary(analysis_results: Dict):
     # Generate recommendations
     print(f"\n🎯 RECOMMENDATIONS")
     print(f"  Recommended selectors:")
-    selectors = generate_selectors_from_analysis(analysis_results)
+    if summary is not None:
+        selectors = summary['common_selectors']
+    else:
+        selectors = generate_selectors_from_analysis(analysis_results)
     for i, selector in enumerate(selectors[:5]):
         print(f"    {i+1}. {selector}")
 
 
 if __name__ == "__main__":
     import sys
-    from datetime import datetime
     
     # Allow custom HTML directory
     html_dir = sys.argv[1] if len(sys.argv) > 1 else "logs/html_debug"
@@ -307,8 +408,9 @@ if __name__ == "__main__":
     results = analyze_saved_html_files(html_dir)
     
     if results:
-        print_analysis_summary(results)
-        save_analysis_report(results)
+        summary = summarize_analysis(results)
+        print_analysis_summary(results, summary)
+        save_analysis_report(results, summary=summary)
         print("\n✅ Analysis completed!")
     else:
         print("❌ No HTML files found to analyze")
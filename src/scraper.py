@@ -4,31 +4,44 @@ Compatible dengan urllib3 2.0+ dan memiliki fallback strategies
 Enhanced with debugging capabilities and content analysis
 """
 
+import atexit
+import codecs
+import functools
+import hashlib
+import importlib.util
+import itertools
 import requests
 import urllib3
 import time
 import random
 import logging
 import json
+import mmap
 import os
 import re
+import shutil
+import socket
+import sys
 import zipfile
-import mimetypes
+from collections import Counter, OrderedDict, deque
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import List, Dict, Optional, Union, Any, Tuple
-from urllib.parse import urljoin, urlparse
+from typing import TYPE_CHECKING, List, Dict, NamedTuple, Optional, Tuple, Union, Callable
+from urllib.parse import urlparse
 from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
 from urllib3.util.retry import Retry
-from bs4 import BeautifulSoup
-import selenium
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
+from lxml import etree, html as lxml_html
+from lxml.cssselect import CSSSelector
+from lxml.html import soupparser
 from tqdm import tqdm
+from tqdm.utils import CallbackIOWrapper
+
+# Selenium is only imported when the fallback driver is first started
+if TYPE_CHECKING:
+    from selenium import webdriver
 
 # Import konfigurasi dan utilities
 try:
@@ -43,16 +56,321 @@ except ImportError:
     from utils import *
 
 
+# Selectors for the putusan listing, compiled once at import time
+SPOST_SELECTOR = CSSSelector('div.spost')
+ALTERNATIVE_SPOST_SELECTORS = [
+    (selector, CSSSelector(selector)) for selector in [
+        '#popular-post-list-sidebar div.spost',
+        '.spost',
+        'div[class*="spost"]'
+    ]
+]
+
+# Divs around any text containing an em dash (candidates for case details),
+# found from the text nodes up so no div's full text has to be built
+CASE_DETAIL_DIVS = etree.XPath('.//text()[contains(., "—")]/ancestor::div')
+
+# Download buttons/links on a putusan detail page, matched in one pass
+DOWNLOAD_LINK_SELECTOR = CSSSelector(
+    'a[href*=".pdf"], a[href*=".zip"], a[href*="download"], '
+    'button[onclick*="download"], .download-btn, .btn-download'
+)
+
+# Enumerations used by HTMLAnalyzer.analyze_html_structure. Counts and
+# attribute values are computed by XPath itself, so no Python element
+# proxies are created for nodes that are only counted or read once
+XP_ELEMENT_COUNT = etree.XPath('count(//*)')
+XP_TABLES = etree.XPath('//table')
+XP_ROWS = etree.XPath('.//tr')
+XP_CELLS = etree.XPath('.//td|.//th')
+XP_FORMS = etree.XPath('//form')
+XP_INPUT_COUNT = etree.XPath('count(.//input)')
+XP_DIV_CLASSES = etree.XPath('//div/@class', smart_strings=False)
+XP_WITH_CLASS_OR_ID = etree.XPath('//*[@class or @id]')
+# Class/id substrings that mark potential data containers
+DATA_INDICATORS = ['data', 'list', 'item', 'row', 'content', 'result', 'putusan', 'document']
+XP_LINK_HREFS = etree.XPath('//a/@href', smart_strings=False)
+XP_SCRIPT_COUNT = etree.XPath('count(//script)')
+XP_EXTERNAL_SCRIPT_COUNT = etree.XPath('count(//script[@src != ""])')
+XP_TITLE = etree.XPath('(//title)[1]')
+XP_META_CHARSET = etree.XPath('(//meta[@charset])[1]')
+XP_META_NAMED = etree.XPath('(//meta[@name=$name])[1]')
+
+# Selector suggestions offered by HTMLAnalyzer (common patterns for court
+# decisions), each with its compiled matcher
+SELECTOR_SUGGESTIONS = [
+    (pattern, CSSSelector(pattern['selector'])) for pattern in [
+        # Table-based layouts
+        {'type': 'table_rows', 'selector': 'table tr', 'description': 'All table rows'},
+        {'type': 'table_rows', 'selector': 'table tbody tr', 'description': 'Table body rows'},
+        {'type': 'table_data', 'selector': 'table td', 'description': 'Table cells'},
+        
+        # List-based layouts
+        {'type': 'list_items', 'selector': 'ul li', 'description': 'Unordered list items'},
+        {'type': 'list_items', 'selector': 'ol li', 'description': 'Ordered list items'},
+        
+        # Div-based layouts
+        {'type': 'div_containers', 'selector': 'div[class*="putusan"]', 'description': 'Divs containing "putusan"'},
+        {'type': 'div_containers', 'selector': 'div[class*="decision"]', 'description': 'Divs containing "decision"'},
+        {'type': 'div_containers', 'selector': 'div[class*="item"]', 'description': 'Divs containing "item"'},
+        {'type': 'div_containers', 'selector': 'div[class*="row"]', 'description': 'Divs containing "row"'},
+        {'type': 'div_containers', 'selector': 'div[class*="list"]', 'description': 'Divs containing "list"'},
+        
+        # Article-based layouts
+        {'type': 'article', 'selector': 'article', 'description': 'Article elements'},
+        {'type': 'section', 'selector': 'section', 'description': 'Section elements'},
+        
+        # Card-based layouts
+        {'type': 'cards', 'selector': 'div[class*="card"]', 'description': 'Card-style containers'},
+        {'type': 'cards', 'selector': 'div[class*="box"]', 'description': 'Box-style containers'},
+    ]
+]
+
+# AJAX/JavaScript keywords, matched in a single pass over the raw markup
+AJAX_KEYWORDS = ['ajax', 'fetch', 'xmlhttprequest', 'api', 'json', 'async']
+AJAX_KEYWORD_PATTERN = re.compile('|'.join(AJAX_KEYWORDS), re.I)
+# Markers of error/block pages and of HTML structure, checked by
+# _validate_response_content on the head of the raw body. Error and block
+# pages announce themselves near the top, so the scan is bounded
+ERROR_INDICATOR_PATTERN = re.compile(
+    rb'error 404|page not found|access denied|forbidden|blocked|captcha|robot', re.I
+)
+HTML_STRUCTURE_PATTERN = re.compile(rb'<(?:html|body|div|table)', re.I)
+ERROR_SCAN_SIZE = 16 * 1024
+STRUCTURE_SCAN_SIZE = 64 * 1024
+# Response bodies are read in chunks; once the first ERROR_SCAN_SIZE bytes
+# are in, they are checked for error indicators before reading the rest
+RESPONSE_CHUNK_SIZE = 64 * 1024
+# Charset declared by the page itself, used when the Content-Type header has none
+META_CHARSET_PATTERN = re.compile(rb'<meta[^>]+charset=["\']?([\w.:-]+)', re.I)
+CHARSET_SCAN_SIZE = 4 * 1024
+# PDF/ZIP downloads are copied straight from the socket in blocks of this size
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+# Text nodes that BeautifulSoup's get_text() would return (no script/style)
+XP_VISIBLE_TEXT = etree.XPath(
+    'descendant-or-self::text()[not(parent::script or parent::style)]', smart_strings=False
+)
+
+# Patterns used when extracting putusan fields
+NOMOR_PATTERN = re.compile(r'Nomor\s+([^<\n]+)')
+PARTIES_SPLIT_PATTERN = re.compile(r'\s+(?:VS|vs)\s+')
+DATE_FIELD_PATTERNS = {
+    'tanggal_register': re.compile(r'Register\s*:\s*([0-9\-/]+)'),
+    'tanggal_putus': re.compile(r'Putus\s*:\s*([0-9\-/]+)'),
+    'tanggal_upload': re.compile(r'Upload\s*:\s*([0-9\-/]+)')
+}
+# The formats _parse_date_string accepts: DD-MM-YYYY, DD/MM/YYYY, DD-MM-YY,
+# DD/MM/YY (one separator throughout) and YYYY-MM-DD
+DATE_STRING_PATTERN = re.compile(
+    r'(?P<day>\d{1,2})(?P<sep>[-/])(?P<month>\d{1,2})(?P=sep)(?P<year>\d{4}|\d{2})'
+    r'|(?P<iso_year>\d{4})-(?P<iso_month>\d{1,2})-(?P<iso_day>\d{1,2})',
+    re.ASCII
+)
+
+# Patterns used when downloading putusan files
+ONCLICK_URL_PATTERN = re.compile(r'["\']([^"\']*\.(?:pdf|zip)[^"\']*)["\']')
+UNSAFE_FILENAME_PATTERN = re.compile(r'[^\w\-_.]')
+
+# Suffix for debug file names: pages fetched concurrently in the same second
+# (e.g. several /direktori?page=N) would otherwise overwrite each other
+_DEBUG_FILE_COUNTER = itertools.count(1)
+
+
+# Resolves with the serialized DOM once the document has finished loading
+# (or after 2 seconds, whichever comes first)
+SELENIUM_PAGE_HTML_SCRIPT = """
+const done = arguments[arguments.length - 1];
+let finished = false;
+const finish = () => {
+    if (!finished) {
+        finished = true;
+        done(document.documentElement.outerHTML);
+    }
+};
+if (document.readyState === 'complete') {
+    finish();
+} else {
+    window.addEventListener('load', finish, {once: true});
+    setTimeout(finish, 2000);
+}
+"""
+
+
+def _element_text(element, strip: bool = False) -> str:
+    """lxml equivalent of BeautifulSoup's get_text()"""
+    if strip:
+        return ''.join(text.strip() for text in element.itertext())
+    return element.text_content()
+
+
+def _visible_text(element, strip: bool = False) -> str:
+    """Like _element_text, but skips script/style contents as BeautifulSoup does"""
+    if strip:
+        return ''.join(text.strip() for text in XP_VISIBLE_TEXT(element))
+    return ''.join(XP_VISIBLE_TEXT(element))
+
+
+@functools.lru_cache(maxsize=256)
+def _compiled_selector(selector: str) -> CSSSelector:
+    """CSSSelector for an ad-hoc selector string, compiled once per string"""
+    return CSSSelector(selector)
+
+
+_CHROMEDRIVER_PATH = None
+_CHROMEDRIVER_LOCK = threading.Lock()
+
+
+def _chromedriver_path() -> str:
+    """Path of the chromedriver binary, resolved (and downloaded if needed) once"""
+    global _CHROMEDRIVER_PATH
+    
+    # Locked so drivers starting in parallel don't race the download
+    with _CHROMEDRIVER_LOCK:
+        if _CHROMEDRIVER_PATH is None:
+            from webdriver_manager.chrome import ChromeDriverManager
+            _CHROMEDRIVER_PATH = ChromeDriverManager().install()
+        return _CHROMEDRIVER_PATH
+
+
+def _parse_document(html_content: Union[str, bytes]):
+    """Parse a full HTML document with lxml, letting bs4 repair what lxml rejects"""
+    try:
+        return lxml_html.document_fromstring(html_content)
+    except (etree.ParserError, ValueError):
+        # lxml refuses empty or undecodable documents
+        return soupparser.fromstring(html_content)
+
+
+def _element_markup(elements: List) -> Optional[str]:
+    """Serialized markup of the first element of an XPath result, or None"""
+    if not elements:
+        return None
+    return etree.tostring(elements[0], encoding=str, with_tail=False)
+
+
+# getaddrinfo results for the scraped host, so reconnects (e.g. after a rate
+# limit backoff) skip the DNS lookup: (host, port, args) -> (expires_at, result)
+_DNS_CACHE = {}
+_DNS_CACHE_LOCK = threading.Lock()
+_original_getaddrinfo = socket.getaddrinfo
+# Scrapers currently using the cache; the original is restored when it drops to 0
+_dns_cache_users = 0
+
+
+def _cached_getaddrinfo(host, port, *args, **kwargs):
+    """socket.getaddrinfo with a TTL cache for the BASE_URL host"""
+    if host != urlparse(BASE_URL).hostname:
+        return _original_getaddrinfo(host, port, *args, **kwargs)
+    
+    key = (host, port, args, tuple(sorted(kwargs.items())))
+    now = time.monotonic()
+    with _DNS_CACHE_LOCK:
+        cached = _DNS_CACHE.get(key)
+    if cached and cached[0] > now:
+        return cached[1]
+    
+    result = _original_getaddrinfo(host, port, *args, **kwargs)
+    with _DNS_CACHE_LOCK:
+        _DNS_CACHE[key] = (now + DNS_CACHE_TTL, result)
+    return result
+
+
+def install_dns_cache() -> bool:
+    """
+    Route socket.getaddrinfo through the BASE_URL host cache (opt-in: only
+    when DNS_CACHE_TTL > 0). Every successful call needs an uninstall_dns_cache().
+    """
+    global _dns_cache_users
+    if DNS_CACHE_TTL <= 0:
+        return False
+    
+    with _DNS_CACHE_LOCK:
+        _dns_cache_users += 1
+        socket.getaddrinfo = _cached_getaddrinfo
+    return True
+
+
+def uninstall_dns_cache():
+    """Restore the original socket.getaddrinfo once the last user is done"""
+    global _dns_cache_users
+    with _DNS_CACHE_LOCK:
+        _dns_cache_users = max(_dns_cache_users - 1, 0)
+        if _dns_cache_users == 0:
+            # Leave it alone if something else has patched it since
+            if socket.getaddrinfo is _cached_getaddrinfo:
+                socket.getaddrinfo = _original_getaddrinfo
+            _DNS_CACHE.clear()
+
+
+class FailedURL(NamedTuple):
+    """A URL that could not be fetched with any method"""
+    url: str
+    timestamp: str
+    error: str
+
+
+class DecorrelatedJitterRetry(Retry):
+    """Retry with decorrelated jitter backoff: min(backoff_max, uniform(base, previous * 3))
+    
+    The first retry is still immediate, as with urllib3's default backoff.
+    """
+    
+    def __init__(self, *args, previous_backoff: float = 0, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.previous_backoff = previous_backoff
+    
+    def new(self, **kw):
+        kw.setdefault('previous_backoff', self.previous_backoff)
+        return super().new(**kw)
+    
+    def get_backoff_time(self) -> float:
+        if super().get_backoff_time() <= 0:
+            return 0
+        
+        base = self.backoff_factor
+        self.previous_backoff = min(
+            self.backoff_max,
+            random.uniform(base, max(base, self.previous_backoff) * 3)
+        )
+        return self.previous_backoff
+
+
 class HTMLAnalyzer:
     """Analyze HTML content to understand structure and find potential selectors"""
     
+    # Analyses of recently seen page bodies (content digest -> analysis),
+    # most recent last; retried or redirected pages are often identical
+    _cache = OrderedDict()
+    _cache_lock = threading.Lock()
+    
     @staticmethod
     def analyze_html_structure(html_content: str, save_analysis: bool = True) -> Dict:
         """Analyze HTML structure and suggest possible selectors"""
-        soup = BeautifulSoup(html_content, 'lxml')
+        if ANALYSIS_CACHE_SIZE <= 0:
+            return HTMLAnalyzer._analyze(html_content, save_analysis)
+        
+        raw = html_content if isinstance(html_content, bytes) else html_content.encode('utf-8', 'surrogatepass')
+        key = hashlib.blake2b(raw, digest_size=16).digest()
+        with HTMLAnalyzer._cache_lock:
+            cached = HTMLAnalyzer._cache.get(key)
+            if cached is not None:
+                HTMLAnalyzer._cache.move_to_end(key)
+                return cached
+        
+        analysis = HTMLAnalyzer._analyze(html_content, save_analysis)
+        with HTMLAnalyzer._cache_lock:
+            HTMLAnalyzer._cache[key] = analysis
+            while len(HTMLAnalyzer._cache) > ANALYSIS_CACHE_SIZE:
+                HTMLAnalyzer._cache.popitem(last=False)
+        return analysis
+    
+    @staticmethod
+    def _analyze(html_content: str, save_analysis: bool) -> Dict:
+        """Uncached analyze_html_structure"""
+        tree = _parse_document(html_content)
         
         analysis = {
-            'total_elements': len(soup.find_all()),
+            'total_elements': int(XP_ELEMENT_COUNT(tree)),
             'tables': [],
             'forms': [],
             'divs_with_classes': [],
@@ -64,48 +382,50 @@ class HTMLAnalyzer:
         }
         
         # Analyze tables
-        tables = soup.find_all('table')
+        tables = XP_TABLES(tree)
         for i, table in enumerate(tables):
-            rows = table.find_all('tr')
+            rows = XP_ROWS(table)
             analysis['tables'].append({
                 'index': i,
                 'rows': len(rows),
-                'columns': len(rows[0].find_all(['td', 'th'])) if rows else 0,
-                'classes': table.get('class', []),
+                'columns': len(XP_CELLS(rows[0])) if rows else 0,
+                'classes': table.get('class', '').split(),
                 'id': table.get('id', ''),
-                'sample_text': table.get_text(strip=True)[:100] if table else ''
+                'sample_text': _visible_text(table, strip=True)[:100]
             })
         
         # Analyze forms
-        forms = soup.find_all('form')
+        forms = XP_FORMS(tree)
         for i, form in enumerate(forms):
             analysis['forms'].append({
                 'index': i,
                 'action': form.get('action', ''),
                 'method': form.get('method', ''),
-                'inputs': len(form.find_all('input')),
-                'classes': form.get('class', [])
+                'inputs': int(XP_INPUT_COUNT(form)),
+                'classes': form.get('class', '').split()
             })
         
         # Analyze divs with classes
-        divs = soup.find_all('div', class_=True)
-        class_counts = {}
-        for div in divs:
-            classes = div.get('class', [])
-            for cls in classes:
-                class_counts[cls] = class_counts.get(cls, 0) + 1
-        
-        analysis['divs_with_classes'] = sorted(
-            class_counts.items(), 
-            key=lambda x: x[1], 
-            reverse=True
-        )[:20]  # Top 20 most common classes
-        
-        # Look for potential data containers
-        data_indicators = ['data', 'list', 'item', 'row', 'content', 'result', 'putusan', 'document']
-        for indicator in data_indicators:
-            elements = soup.find_all(attrs={'class': re.compile(indicator, re.I)})
-            elements.extend(soup.find_all(attrs={'id': re.compile(indicator, re.I)}))
+        # Counter tallies the joined tokens in C (_count_elements)
+        class_counts = Counter(' '.join(XP_DIV_CLASSES(tree)).split())
+        
+        analysis['divs_with_classes'] = class_counts.most_common(20)  # Top 20 most common classes
+        
+        # Look for potential data containers (one pass; class matches are
+        # listed before id matches for each indicator)
+        class_matches = {indicator: [] for indicator in DATA_INDICATORS}
+        id_matches = {indicator: [] for indicator in DATA_INDICATORS}
+        for elem in XP_WITH_CLASS_OR_ID(tree):
+            elem_class = elem.get('class', '').lower()
+            elem_id = elem.get('id', '').lower()
+            for indicator in DATA_INDICATORS:
+                if indicator in elem_class:
+                    class_matches[indicator].append(elem)
+                if indicator in elem_id:
+                    id_matches[indicator].append(elem)
+        
+        for indicator in DATA_INDICATORS:
+            elements = class_matches[indicator] + id_matches[indicator]
             
             if elements:
                 analysis['potential_data_containers'].append({
@@ -113,49 +433,51 @@ class HTMLAnalyzer:
                     'count': len(elements),
                     'sample_elements': [
                         {
-                            'tag': elem.name,
-                            'classes': elem.get('class', []),
+                            'tag': elem.tag,
+                            'classes': elem.get('class', '').split(),
                             'id': elem.get('id', ''),
-                            'text_preview': elem.get_text(strip=True)[:100]
+                            'text_preview': _visible_text(elem, strip=True)[:100]
                         } for elem in elements[:3]
                     ]
                 })
         
         # Analyze links
-        links = soup.find_all('a', href=True)
+        hrefs = XP_LINK_HREFS(tree)
         analysis['links'] = {
-            'total': len(links),
-            'internal': len([l for l in links if not l['href'].startswith('http')]),
-            'external': len([l for l in links if l['href'].startswith('http')]),
-            'sample_hrefs': [l['href'] for l in links[:10]]
+            'total': len(hrefs),
+            'internal': len([h for h in hrefs if not h.startswith('http')]),
+            'external': len([h for h in hrefs if h.startswith('http')]),
+            'sample_hrefs': hrefs[:10]
         }
         
         # Analyze scripts
-        scripts = soup.find_all('script')
+        script_count = int(XP_SCRIPT_COUNT(tree))
+        external_scripts = int(XP_EXTERNAL_SCRIPT_COUNT(tree))
         analysis['scripts'] = {
-            'total': len(scripts),
-            'external': len([s for s in scripts if s.get('src')]),
-            'inline': len([s for s in scripts if not s.get('src')]),
+            'total': script_count,
+            'external': external_scripts,
+            'inline': script_count - external_scripts,
             'ajax_indicators': []
         }
         
-        # Check for AJAX indicators
-        page_text = soup.get_text().lower()
-        ajax_keywords = ['ajax', 'fetch', 'xmlhttprequest', 'api', 'json', 'async']
-        for keyword in ajax_keywords:
-            if keyword in page_text:
-                analysis['scripts']['ajax_indicators'].append(keyword)
+        # Check for AJAX indicators in the page text (not the markup), as
+        # BeautifulSoup's get_text() did; html_content may be bytes
+        found_keywords = {match.lower() for match in AJAX_KEYWORD_PATTERN.findall(_visible_text(tree))}
+        analysis['scripts']['ajax_indicators'] = [
+            keyword for keyword in AJAX_KEYWORDS if keyword in found_keywords
+        ]
         
         # Meta information
+        titles = XP_TITLE(tree)
         analysis['meta_info'] = {
-            'title': soup.title.string if soup.title else '',
-            'charset': soup.find('meta', {'charset': True}),
-            'viewport': soup.find('meta', {'name': 'viewport'}),
-            'generator': soup.find('meta', {'name': 'generator'})
+            'title': titles[0].text if titles else '',
+            'charset': _element_markup(XP_META_CHARSET(tree)),
+            'viewport': _element_markup(XP_META_NAMED(tree, name='viewport')),
+            'generator': _element_markup(XP_META_NAMED(tree, name='generator'))
         }
         
         # Generate possible selectors
-        analysis['possible_selectors'] = HTMLAnalyzer._generate_selector_suggestions(soup)
+        analysis['possible_selectors'] = HTMLAnalyzer._generate_selector_suggestions(tree)
         
         if save_analysis:
             HTMLAnalyzer._save_analysis(analysis)
@@ -163,44 +485,17 @@ class HTMLAnalyzer:
         return analysis
     
     @staticmethod
-    def _generate_selector_suggestions(soup: BeautifulSoup) -> List[Dict]:
+    def _generate_selector_suggestions(tree) -> List[Dict]:
         """Generate possible selector suggestions based on content analysis"""
         suggestions = []
         
-        # Common patterns for court decisions
-        decision_patterns = [
-            # Table-based layouts
-            {'type': 'table_rows', 'selector': 'table tr', 'description': 'All table rows'},
-            {'type': 'table_rows', 'selector': 'table tbody tr', 'description': 'Table body rows'},
-            {'type': 'table_data', 'selector': 'table td', 'description': 'Table cells'},
-            
-            # List-based layouts
-            {'type': 'list_items', 'selector': 'ul li', 'description': 'Unordered list items'},
-            {'type': 'list_items', 'selector': 'ol li', 'description': 'Ordered list items'},
-            
-            # Div-based layouts
-            {'type': 'div_containers', 'selector': 'div[class*="putusan"]', 'description': 'Divs containing "putusan"'},
-            {'type': 'div_containers', 'selector': 'div[class*="decision"]', 'description': 'Divs containing "decision"'},
-            {'type': 'div_containers', 'selector': 'div[class*="item"]', 'description': 'Divs containing "item"'},
-            {'type': 'div_containers', 'selector': 'div[class*="row"]', 'description': 'Divs containing "row"'},
-            {'type': 'div_containers', 'selector': 'div[class*="list"]', 'description': 'Divs containing "list"'},
-            
-            # Article-based layouts
-            {'type': 'article', 'selector': 'article', 'description': 'Article elements'},
-            {'type': 'section', 'selector': 'section', 'description': 'Section elements'},
-            
-            # Card-based layouts
-            {'type': 'cards', 'selector': 'div[class*="card"]', 'description': 'Card-style containers'},
-            {'type': 'cards', 'selector': 'div[class*="box"]', 'description': 'Box-style containers'},
-        ]
-        
-        for pattern in decision_patterns:
-            elements = soup.select(pattern['selector'])
+        for pattern, matcher in SELECTOR_SUGGESTIONS:
+            elements = matcher(tree)
             if elements:
                 suggestions.append({
                     **pattern,
                     'found_count': len(elements),
-                    'sample_text': elements[0].get_text(strip=True)[:100] if elements else ''
+                    'sample_text': _visible_text(elements[0], strip=True)[:100] if elements else ''
                 })
         
         return suggestions
@@ -212,11 +507,10 @@ class HTMLAnalyzer:
             analysis_dir = "logs/html_analysis"
             os.makedirs(analysis_dir, exist_ok=True)
             
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{next(_DEBUG_FILE_COUNTER)}"
             filepath = os.path.join(analysis_dir, f"html_analysis_{timestamp}.json")
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(analysis, f, indent=2, ensure_ascii=False, default=str)
+            write_json(filepath, analysis, default=str)
             
             print(f"📊 HTML analysis saved to: {filepath}")
             
@@ -228,8 +522,13 @@ class NetworkDebugger:
     """Debug network requests and responses"""
     
     @staticmethod
-    def analyze_response(response: requests.Response, save_debug: bool = True) -> Dict:
-        """Analyze HTTP response for debugging"""
+    def analyze_response(response: requests.Response, save_debug: bool = True,
+                         write_file: Optional[Callable[[str, bytes], None]] = None) -> Dict:
+        """Analyze HTTP response for debugging
+        
+        write_file(path, data), if given, takes over writing the debug files
+        (e.g. to hand them to a background writer).
+        """
         analysis = {
             'status_code': response.status_code,
             'headers': dict(response.headers),
@@ -245,7 +544,8 @@ class NetworkDebugger:
         
         # Analyze content
         if response.content:
-            content_text = response.text[:1000]  # First 1000 chars
+            # First 1000 chars, decoding only the head of the body
+            content_text = response.content[:4000].decode(response.encoding or 'utf-8', 'replace')[:1000]
             analysis['content_analysis'] = {
                 'starts_with': content_text[:100],
                 'contains_html': '<html' in content_text.lower(),
@@ -258,28 +558,34 @@ class NetworkDebugger:
             }
         
         if save_debug:
-            NetworkDebugger._save_response_debug(analysis, response)
+            NetworkDebugger._save_response_debug(analysis, response, write_file)
         
         return analysis
     
     @staticmethod
-    def _save_response_debug(analysis: Dict, response: requests.Response):
+    def _save_response_debug(analysis: Dict, response: requests.Response,
+                             write_file: Optional[Callable[[str, bytes], None]] = None):
         """Save response debug information"""
         try:
             debug_dir = "logs/network_debug"
             os.makedirs(debug_dir, exist_ok=True)
             
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{next(_DEBUG_FILE_COUNTER)}"
             
-            # Save analysis
             analysis_file = os.path.join(debug_dir, f"response_analysis_{timestamp}.json")
-            with open(analysis_file, 'w', encoding='utf-8') as f:
-                json.dump(analysis, f, indent=2, ensure_ascii=False, default=str)
+            response_file = os.path.join(debug_dir, f"response_content_{timestamp}.html")
+            
+            if write_file is not None:
+                write_file(analysis_file, dump_json(analysis, default=str))
+                write_file(response_file, response.content)
+                return
+            
+            # Save analysis
+            write_json(analysis_file, analysis, default=str)
             
             # Save raw response
-            response_file = os.path.join(debug_dir, f"response_content_{timestamp}.html")
-            with open(response_file, 'w', encoding='utf-8') as f:
-                f.write(response.text)
+            with open(response_file, 'wb') as f:
+                f.write(response.content)
             
             print(f"🔍 Network debug saved: {analysis_file}")
             
@@ -292,13 +598,42 @@ class MahkamahAgungScraper:
     Enhanced scraper with comprehensive debugging capabilities
     """
     
-    def __init__(self, debug: bool = False, interactive_debug: bool = False):
+    def __init__(self, debug: bool = False, interactive_debug: bool = False, use_disk_cache: bool = False):
         self.debug = debug
         self.interactive_debug = interactive_debug
+        # Reuse pages saved in HTTP_CACHE_DIR by earlier runs (e.g. when resuming)
+        self.use_disk_cache = use_disk_cache
         self.session = None
-        self.driver = None
+        # Selenium drivers are not thread-safe, so each fetch thread borrows
+        # one from a pool. Drivers are started on demand, up to pool_size
+        self._driver_pool = queue.Queue()
+        self._drivers = []
+        self._drivers_starting = 0
+        self._driver_page_counts = {}
+        self._driver_lock = threading.Lock()
+        self._cleanup_registered = False
+        # Recently fetched pages (url -> HTML), most recent last
+        self._page_cache = OrderedDict()
+        self._page_cache_lock = threading.Lock()
+        # Fallback listing selector that matched on the last page without div.spost
+        self._learned_spost_selector = None
+        # Shared token bucket that paces every outgoing request; it slows
+        # down on 429 responses and recovers after a run of successes
+        self.rate_limiter = RateLimiter(
+            REQUESTS_PER_SECOND,
+            min_rate=RATE_LIMIT_MIN_RATE,
+            recovery_streak=RATE_RECOVERY_STREAK
+        )
+        # Debug HTML is written by a background thread, started on first use
+        # (under the lock, since any fetch thread may be first)
+        self._debug_queue = None
+        self._debug_writer = None
+        self._debug_writer_lock = threading.Lock()
         self.scraped_data = []
-        self.failed_urls = []
+        # Nomor of every record in scraped_data, so duplicates are dropped as pages arrive
+        self._seen_keys = set()
+        # url -> FailedURL for the latest failure
+        self.failed_urls = {}
         self.stats = {
             'total_requests': 0,
             'successful_requests': 0,
@@ -306,6 +641,8 @@ class MahkamahAgungScraper:
             'method_used': {},
             'errors': []
         }
+        # Guards stats and failed_urls, updated by every page fetch thread
+        self._stats_lock = threading.Lock()
         
         # Setup logging
         self._setup_logging()
@@ -324,13 +661,18 @@ class MahkamahAgungScraper:
         self.download_dir = os.path.join(os.getcwd(), 'downloads')
         os.makedirs(self.download_dir, exist_ok=True)
         
-        # Download stats
+        # Download stats, updated by every download thread
         self.download_stats = {
             'pdf_downloads': 0,
             'zip_downloads': 0,
             'failed_downloads': 0,
             'total_size': 0
         }
+        self._download_stats_lock = threading.Lock()
+        # url -> ETag/Last-Modified of downloaded files, kept across runs to
+        # decide whether a local copy can be skipped or resumed
+        self._download_validators_file = os.path.join(self.download_dir, 'validators.json')
+        self._download_validators = self._load_download_validators()
     
     def _setup_logging(self):
         """Setup logging configuration"""
@@ -361,10 +703,11 @@ class MahkamahAgungScraper:
             
     def _setup_requests_session(self):
         """Setup requests session dengan retry strategy yang modern"""
+        self._dns_cache_installed = install_dns_cache()
         self.session = requests.Session()
         
         # Modern retry strategy untuk urllib3 2.0+
-        retry_strategy = Retry(
+        retry_strategy = DecorrelatedJitterRetry(
             total=MAX_RETRIES,
             status_forcelist=[429, 500, 502, 503, 504],
             # Menggunakan allowed_methods bukan method_whitelist (deprecated)
@@ -377,8 +720,9 @@ class MahkamahAgungScraper:
         # Setup adapter dengan retry strategy
         adapter = HTTPAdapter(
             max_retries=retry_strategy,
-            pool_connections=10,
-            pool_maxsize=20
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            pool_block=False
         )
         
         self.session.mount("http://", adapter)
@@ -389,16 +733,21 @@ class MahkamahAgungScraper:
             'User-Agent': random.choice(USER_AGENTS),
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'id-ID,id;q=0.9,en;q=0.8',
-            'Accept-Encoding': 'gzip, deflate',
+            # gzip/deflate plus br/zstd when brotli/zstandard are installed
+            'Accept-Encoding': ACCEPT_ENCODING,
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
         })
         
         self.logger.info("Requests session initialized with modern retry strategy")
         
-    def _setup_selenium_driver(self) -> bool:
-        """Setup selenium driver sebagai fallback"""
+    def _build_driver(self) -> Optional['webdriver.Chrome']:
+        """Start a selenium driver sebagai fallback"""
         try:
+            from selenium import webdriver
+            from selenium.webdriver.chrome.options import Options
+            from selenium.webdriver.chrome.service import Service
+            
             chrome_options = Options()
             
             if SELENIUM_CONFIG['headless']:
@@ -412,39 +761,142 @@ class MahkamahAgungScraper:
             chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
             chrome_options.add_experimental_option('useAutomationExtension', False)
             
+            # Don't load images, stylesheets or fonts; only the DOM is parsed
+            chrome_options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.managed_default_content_settings.stylesheets": 2,
+                "profile.managed_default_content_settings.fonts": 2
+            })
+            
             # Set user agent
             chrome_options.add_argument(f'--user-agent={random.choice(USER_AGENTS)}')
             
             # Install dan setup driver
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            service = Service(_chromedriver_path())
+            driver = webdriver.Chrome(service=service, options=chrome_options)
             
             # Set timeouts
-            self.driver.set_page_load_timeout(SELENIUM_CONFIG['page_load_timeout'])
-            self.driver.implicitly_wait(SELENIUM_CONFIG['implicit_wait'])
+            driver.set_page_load_timeout(SELENIUM_CONFIG['page_load_timeout'])
+            driver.implicitly_wait(SELENIUM_CONFIG['implicit_wait'])
             
             # Execute script to remove webdriver property
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            
+            # Block remaining static resources and trackers at the network level
+            try:
+                driver.execute_cdp_cmd("Network.enable", {})
+                driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": SELENIUM_CONFIG['blocked_urls']})
+            except Exception as e:
+                self.logger.debug(f"Could not enable network blocking: {e}")
+            
+            # Make sure Chrome is closed even if cleanup() is never called
+            if not self._cleanup_registered:
+                atexit.register(self.cleanup)
+                self._cleanup_registered = True
             
             self.logger.info("Selenium driver initialized successfully")
-            return True
+            return driver
             
         except Exception as e:
             self.logger.error(f"Failed to setup Selenium driver: {e}")
-            return False
+            return None
+    
+    def _acquire_driver(self) -> Optional['webdriver.Chrome']:
+        """Borrow an idle driver from the pool, starting one if the pool is not full"""
+        while True:
+            try:
+                return self._driver_pool.get_nowait()
+            except queue.Empty:
+                pass
+            
+            with self._driver_lock:
+                can_start = len(self._drivers) + self._drivers_starting < SELENIUM_CONFIG['pool_size']
+                if can_start:
+                    self._drivers_starting += 1
+            
+            if can_start:
+                # Chrome is started outside the lock so pool slots fill in parallel
+                driver = self._build_driver()
+                with self._driver_lock:
+                    self._drivers_starting -= 1
+                    if driver is not None:
+                        self._drivers.append(driver)
+                        self._driver_page_counts[driver] = 0
+                return driver
+            
+            # Pool is full; wait for another thread to return a driver
+            try:
+                return self._driver_pool.get(timeout=1)
+            except queue.Empty:
+                continue
+    
+    def _release_driver(self, driver: 'webdriver.Chrome'):
+        """Return a driver to the pool, or retire it once it has loaded enough pages"""
+        with self._driver_lock:
+            if driver not in self._driver_page_counts:
+                # The pool was shut down while this driver was in use
+                return
+            
+            self._driver_page_counts[driver] += 1
+            pages = self._driver_page_counts[driver]
+            # Restart Chrome periodically so its memory use stays bounded
+            retire = pages >= SELENIUM_CONFIG['max_pages_per_driver']
+            if retire:
+                self._drivers.remove(driver)
+                del self._driver_page_counts[driver]
+        
+        if retire:
+            self.logger.info(f"Restarting Selenium driver after {pages} pages")
+            self._quit_driver(driver)
+        else:
+            self._driver_pool.put(driver)
+    
+    def _get_content_selenium(self, url: str) -> Optional[str]:
+        """Get page content menggunakan Selenium (fallback)"""
+        driver = self._acquire_driver()
+        if driver is None:
+            return None
+        
+        try:
+            self.logger.debug(f"Attempting to fetch {url} using selenium")
+            driver.get(url)
+            
+            # Wait for the document and serialize it in one script call instead
+            # of going through page_source
+            content = driver.execute_async_script(SELENIUM_PAGE_HTML_SCRIPT)
+        finally:
+            self._release_driver(driver)
+        
+        if not content or len(content) < 100:
+            self.logger.warning(f"Selenium returned no usable content for {url}")
+            return None
+        
+        return content
+    
+    def _quit_driver(self, driver: 'webdriver.Chrome'):
+        """Quit a Selenium driver"""
+        try:
+            driver.quit()
+        except Exception as e:
+            self.logger.warning(f"Error closing driver: {e}")
+    
+    def _quit_all_drivers(self):
+        """Quit every pooled Selenium driver"""
+        with self._driver_lock:
+            drivers, self._drivers = self._drivers, []
+            self._driver_page_counts.clear()
+            self._driver_pool = queue.Queue()
+        
+        for driver in drivers:
+            self._quit_driver(driver)
     
     def _rotate_user_agent(self):
         """Rotate user agent untuk menghindari detection"""
         if self.session:
             self.session.headers.update({'User-Agent': random.choice(USER_AGENTS)})
             
-    def _random_delay(self, delay_range: tuple = DELAY_RANGE):
-        """Add random delay between requests"""
-        delay = random.uniform(delay_range[0], delay_range[1])
-        time.sleep(delay)
-        
     def _handle_rate_limit(self, response: requests.Response) -> bool:
-        """Handle rate limiting dengan exponential backoff"""
+        """Handle rate limiting dengan decorrelated jitter backoff"""
         if response.status_code == 429:
             self.logger.warning("Rate limited detected, implementing backoff strategy")
             
@@ -454,17 +906,20 @@ class MahkamahAgungScraper:
                 try:
                     wait_time = int(retry_after)
                     self.logger.info(f"Retry-After header found, waiting {wait_time} seconds")
+                    # Every fetch thread waits it out, not only this one
+                    self.rate_limiter.slow_down(wait_time)
                     time.sleep(wait_time)
                     return True
                 except ValueError:
                     pass
             
-            # Exponential backoff
+            self.rate_limiter.slow_down()
+            
+            # Decorrelated jitter: each wait is drawn between the base delay
+            # and three times the previous wait
+            wait_time = RATE_LIMIT_DELAY_RANGE[0]
             for attempt in range(3):
-                wait_time = random.uniform(
-                    RATE_LIMIT_DELAY_RANGE[0] * (2 ** attempt),
-                    RATE_LIMIT_DELAY_RANGE[1] * (2 ** attempt)
-                )
+                wait_time = min(RATE_LIMIT_CAP, random.uniform(RATE_LIMIT_DELAY_RANGE[0], wait_time * 3))
                 self.logger.info(f"Rate limit backoff attempt {attempt + 1}, waiting {wait_time:.2f} seconds")
                 time.sleep(wait_time)
                 
@@ -493,23 +948,37 @@ class MahkamahAgungScraper:
         Returns:
             HTML content atau None jika gagal
         """
-        self.stats['total_requests'] += 1
+        cached = self._get_cached_page(url)
+        if cached is not None:
+            self.logger.debug(f"Using cached content for {url}")
+            return cached
+        
+        if self.use_disk_cache:
+            cached = self._read_disk_cache(url)
+            if cached is not None:
+                self.logger.debug(f"Using disk cached content for {url}")
+                self._cache_page(url, cached)
+                return cached
+        
+        with self._stats_lock:
+            self.stats['total_requests'] += 1
         
         # Method 1: Requests
         if method in ['requests', 'auto']:
             try:
                 content = self._get_content_requests(url)
                 if content:
-                    self.stats['successful_requests'] += 1
-                    self.stats['method_used']['requests'] = self.stats['method_used'].get('requests', 0) + 1
+                    self._record_success('requests')
+                    self._cache_page(url, content)
+                    self._write_disk_cache(url, content)
                     return content
                 elif method == 'requests':
-                    self.stats['failed_requests'] += 1
+                    self._record_failure()
                     return None
             except Exception as e:
                 self.logger.warning(f"Requests method failed for {url}: {e}")
                 if method == 'requests':
-                    self.stats['failed_requests'] += 1
+                    self._record_failure()
                     return None
         
         # Method 2: Selenium (fallback)
@@ -517,89 +986,185 @@ class MahkamahAgungScraper:
             try:
                 content = self._get_content_selenium(url)
                 if content:
-                    self.stats['successful_requests'] += 1
-                    self.stats['method_used']['selenium'] = self.stats['method_used'].get('selenium', 0) + 1
+                    self._record_success('selenium')
+                    self._cache_page(url, content)
+                    self._write_disk_cache(url, content)
                     return content
             except Exception as e:
                 self.logger.warning(f"Selenium method failed for {url}: {e}")
         
         # All methods failed
-        self.stats['failed_requests'] += 1
-        self.failed_urls.append({
-            'url': url,
-            'timestamp': datetime.now().isoformat(),
-            'error': 'All methods failed'
-        })
+        self._record_failure(url, 'All methods failed')
         return None
     
+    def _record_success(self, method: str):
+        """Count a successful page fetch made with method"""
+        with self._stats_lock:
+            self.stats['successful_requests'] += 1
+            self.stats['method_used'][method] = self.stats['method_used'].get(method, 0) + 1
+    
+    def _record_failure(self, url: str = None, error: str = None):
+        """Count a failed page fetch, remembering url when given"""
+        with self._stats_lock:
+            self.stats['failed_requests'] += 1
+            if url:
+                self.failed_urls[url] = FailedURL(url, datetime.now().isoformat(), error)
+    
+    def _get_cached_page(self, url: str) -> Optional[str]:
+        """Return the cached HTML for url, if it was fetched recently"""
+        with self._page_cache_lock:
+            content = self._page_cache.get(url)
+            if content is not None:
+                self._page_cache.move_to_end(url)
+            return content
+    
+    def _cache_page(self, url: str, content: str):
+        """Remember a fetched page, evicting the least recently used ones"""
+        if PAGE_CACHE_SIZE <= 0:
+            return
+        
+        with self._page_cache_lock:
+            self._page_cache[url] = content
+            self._page_cache.move_to_end(url)
+            while len(self._page_cache) > PAGE_CACHE_SIZE:
+                self._page_cache.popitem(last=False)
+    
+    def _decode_response(self, response: requests.Response) -> str:
+        """
+        Decode an HTML body
+        
+        Without a charset in Content-Type, requests would fall back to
+        ISO-8859-1 for text/html (or run charset detection for other types).
+        The page's own <meta charset> is used instead, defaulting to UTF-8.
+        """
+        if 'charset' not in response.headers.get('content-type', '').lower():
+            match = META_CHARSET_PATTERN.search(response.content[:CHARSET_SCAN_SIZE])
+            response.encoding = match.group(1).decode('ascii') if match else 'utf-8'
+        return response.text
+    
+    def _disk_cache_path(self, url: str) -> str:
+        """File in HTTP_CACHE_DIR that holds the cached HTML for url"""
+        key = hashlib.blake2b(url.encode('utf-8'), digest_size=16).hexdigest()
+        return os.path.join(HTTP_CACHE_DIR, f"{key}.html")
+    
+    def _read_disk_cache(self, url: str) -> Optional[str]:
+        """Return the HTML saved for url by an earlier fetch, if it's not older than HTTP_CACHE_TTL"""
+        filepath = self._disk_cache_path(url)
+        try:
+            if time.time() - os.stat(filepath).st_mtime > HTTP_CACHE_TTL:
+                return None
+            with open(filepath, 'r', encoding='utf-8') as f:
+                return f.read()
+        except OSError:
+            return None
+    
+    def _write_disk_cache(self, url: str, content: str):
+        """Save a fetched page to the on-disk cache (no-op unless use_disk_cache)"""
+        if not self.use_disk_cache:
+            return
+        
+        filepath = self._disk_cache_path(url)
+        try:
+            os.makedirs(HTTP_CACHE_DIR, exist_ok=True)
+            # Written to a temporary file first so readers never see a partial page
+            tmp_path = f"{filepath}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+                f.write(content)
+            os.replace(tmp_path, filepath)
+        except OSError as e:
+            self.logger.debug(f"Could not cache {url} on disk: {e}")
+    
     def _get_content_requests(self, url: str) -> Optional[str]:
         """Enhanced get content with comprehensive debugging"""
         try:
             self.logger.debug(f"Attempting to fetch {url} using requests")
             
-            # Random delay
-            self._random_delay()
+            # Pace requests across all fetch threads, with a little jitter
+            self.rate_limiter.acquire()
+            time.sleep(random.uniform(0, REQUEST_JITTER))
             
             # Rotate user agent occasionally
             if random.random() < 0.1:  # 10% chance
                 self._rotate_user_agent()
             
-            # Log request details
-            self.logger.debug(f"Request headers: {dict(self.session.headers)}")
+            # Log request details (the header dict is only built when it's logged)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Request headers: {dict(self.session.headers)}")
             
-            response = self.session.get(
+            # Stream so the body is only downloaded (and decompressed) once
+            # the headers show it is a page we can parse
+            with self.session.get(
                 url,
                 timeout=DEFAULT_TIMEOUT,
                 allow_redirects=True,
-                verify=True
-            )
-            
-            # Enhanced response analysis
-            if self.debug:
-                analysis = self.network_debugger.analyze_response(response)
-                self.logger.debug(f"Response analysis: {analysis}")
+                verify=True,
+                stream=True
+            ) as response:
+                if not self._is_parsable_response(response):
+                    return None
                 
-                # Interactive debugging
-                if self.interactive_debug:
-                    self._interactive_response_debug(response, analysis)
-            
-            # Handle different status codes
-            if response.status_code == 200:
-                self.logger.debug(f"Successfully fetched {url}")
+                # Read the body (within MAX_PAGE_SIZE) before anything touches
+                # response.content; error pages are only read when debugging
+                body = None
+                if response.status_code == 200 or self.debug:
+                    body = self._read_response_body(response)
                 
-                # Enhanced content validation
-                if not self._validate_response_content(response):
-                    self.logger.warning(f"Response content validation failed for {url}")
-                    return None
+                # Enhanced response analysis
+                if self.debug and body is not None:
+                    analysis = self.network_debugger.analyze_response(
+                        response, write_file=self._queue_debug_file
+                    )
+                    self.logger.debug(f"Response analysis: {analysis}")
                 
-                # Save debug HTML with analysis
-                if self.debug:
-                    self._save_debug_html(url, response.text)
-                    # Analyze HTML structure
-                    html_analysis = self.html_analyzer.analyze_html_structure(response.text)
-                    self.logger.debug(f"HTML analysis: Found {html_analysis['total_elements']} elements")
+                    # Interactive debugging
+                    if self.interactive_debug:
+                        self._interactive_response_debug(response, analysis)
+            
+                # Handle different status codes
+                if response.status_code == 200:
+                    self.logger.debug(f"Successfully fetched {url}")
+                    self.rate_limiter.record_success()
+                    
+                    if not body:
+                        self.logger.warning(f"Response content validation failed for {url}")
+                        return None
+                    
+                    # Enhanced content validation
+                    if not self._validate_response_content(response):
+                        self.logger.warning(f"Response content validation failed for {url}")
+                        return None
+                    
+                    # response.text decodes the body on every access, so do it once
+                    content = self._decode_response(response)
+                
+                    # Save debug HTML with analysis
+                    if self.debug:
+                        self._save_debug_html(url, response.content)
+                        # Analyze HTML structure
+                        html_analysis = self.html_analyzer.analyze_html_structure(content)
+                        self.logger.debug(f"HTML analysis: Found {html_analysis['total_elements']} elements")
                 
-                return response.text
-            
-            elif response.status_code == 429:
-                self.logger.warning(f"Rate limited for {url}")
-                if self._handle_rate_limit(response):
-                    # Retry after handling rate limit
-                    retry_response = self.session.get(url, timeout=DEFAULT_TIMEOUT)
-                    if retry_response.status_code == 200:
-                        return retry_response.text
+                    return content
+            
+                elif response.status_code == 429:
+                    self.logger.warning(f"Rate limited for {url}")
+                    if self._handle_rate_limit(response):
+                        # Retry after handling rate limit
+                        retry_response = self.session.get(url, timeout=DEFAULT_TIMEOUT)
+                        if retry_response.status_code == 200:
+                            return self._decode_response(retry_response)
                 
-            elif response.status_code in [403, 406]:
-                self.logger.warning(f"Access forbidden for {url}, might be blocked")
-                raise Exception(f"Access forbidden (HTTP {response.status_code})")
+                elif response.status_code in [403, 406]:
+                    self.logger.warning(f"Access forbidden for {url}, might be blocked")
+                    raise Exception(f"Access forbidden (HTTP {response.status_code})")
                 
-            elif response.status_code >= 500:
-                self.logger.warning(f"Server error for {url}: HTTP {response.status_code}")
-                raise Exception(f"Server error (HTTP {response.status_code})")
+                elif response.status_code >= 500:
+                    self.logger.warning(f"Server error for {url}: HTTP {response.status_code}")
+                    raise Exception(f"Server error (HTTP {response.status_code})")
                 
-            else:
-                self.logger.warning(f"Unexpected status code {response.status_code} for {url}")
-                raise Exception(f"HTTP {response.status_code}")
+                else:
+                    self.logger.warning(f"Unexpected status code {response.status_code} for {url}")
+                    raise Exception(f"HTTP {response.status_code}")
                 
         except requests.exceptions.Timeout:
             self.logger.warning(f"Timeout for {url}")
@@ -615,33 +1180,124 @@ class MahkamahAgungScraper:
             
         return None
     
+    def _is_parsable_response(self, response: requests.Response) -> bool:
+        """Check the headers of a streamed response before reading its body"""
+        content_type = response.headers.get('Content-Type', '').lower()
+        if content_type and not any(kind in content_type for kind in ('html', 'xml')):
+            self.logger.warning(f"Skipping non-HTML response ({content_type}) for {response.url}")
+            return False
+        
+        content_length = response.headers.get('Content-Length')
+        if content_length and content_length.isdigit() and int(content_length) > MAX_PAGE_SIZE:
+            self.logger.warning(f"Skipping oversized response ({content_length} bytes) for {response.url}")
+            return False
+        
+        return True
+    
+    def _read_response_body(self, response: requests.Response) -> Optional[bytes]:
+        """
+        Read a streamed response body in chunks, stopping early for error pages
+        and bodies over MAX_PAGE_SIZE
+        
+        The body is kept on the response, so response.content/.text work as usual.
+        """
+        chunks = []
+        size = 0
+        probed = False
+        
+        for chunk in response.iter_content(RESPONSE_CHUNK_SIZE):
+            chunks.append(chunk)
+            size += len(chunk)
+            
+            if size > MAX_PAGE_SIZE:
+                self.logger.warning(f"Skipping oversized response (over {MAX_PAGE_SIZE} bytes) for {response.url}")
+                return None
+            
+            # _validate_response_content would reject the page anyway
+            if not probed and size >= ERROR_SCAN_SIZE:
+                probed = True
+                error_match = ERROR_INDICATOR_PATTERN.search(b''.join(chunks), 0, ERROR_SCAN_SIZE)
+                if error_match:
+                    self.logger.warning(f"Error indicator found in content: {error_match.group().decode().lower()}")
+                    return None
+        
+        response._content = b''.join(chunks)
+        return response._content
+    
+    def _save_debug_html(self, url: str, content: Union[str, bytes], method: str = 'requests'):
+        """Queue page HTML to be saved under logs/html_debug for later analysis"""
+        parsed = urlparse(url)
+        page_name = parsed.path.rstrip('/').replace('/', '_') or 'index'
+        if parsed.query:
+            page_name += '_' + UNSAFE_FILENAME_PATTERN.sub('_', parsed.query)
+        filepath = os.path.join(
+            LOG_DIR, 'html_debug',
+            f"{method}_{page_name}_{int(time.time())}_{next(_DEBUG_FILE_COUNTER)}.html"
+        )
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        
+        self._queue_debug_file(filepath, content)
+    
+    def _queue_debug_file(self, filepath: str, content: bytes):
+        """Hand a debug file to the background writer thread"""
+        with self._debug_writer_lock:
+            if self._debug_writer is None:
+                self._debug_queue = queue.Queue(maxsize=64)
+                self._debug_writer = threading.Thread(target=self._debug_writer_loop, daemon=True)
+                self._debug_writer.start()
+            debug_queue = self._debug_queue
+        
+        try:
+            debug_queue.put_nowait((filepath, content))
+        except queue.Full:
+            self.logger.warning(f"Debug writer queue full, not saving {filepath}")
+    
+    def _debug_writer_loop(self):
+        """Write queued debug files until the None sentinel arrives"""
+        os.makedirs(os.path.join(LOG_DIR, 'html_debug'), exist_ok=True)
+        
+        while True:
+            item = self._debug_queue.get()
+            if item is None:
+                break
+            
+            filepath, content = item
+            try:
+                fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    os.write(fd, content)
+                finally:
+                    os.close(fd)
+                self.logger.debug(f"Debug file saved to {filepath}")
+            except OSError as e:
+                self.logger.warning(f"Failed to save debug file {filepath}: {e}")
+    
+    def _stop_debug_writer(self):
+        """Flush pending debug HTML and stop the writer thread"""
+        with self._debug_writer_lock:
+            if self._debug_writer is not None:
+                self._debug_queue.put(None)
+                self._debug_writer.join()
+                self._debug_writer = None
+    
     def _validate_response_content(self, response: requests.Response) -> bool:
         """Validate that response contains expected content"""
-        content = response.text.lower()
+        content = response.content
         
         # Check for common error indicators
-        error_indicators = [
-            'error 404',
-            'page not found',
-            'access denied',
-            'forbidden',
-            'blocked',
-            'captcha',
-            'robot'
-        ]
-        
-        for indicator in error_indicators:
-            if indicator in content:
-                self.logger.warning(f"Error indicator found in content: {indicator}")
-                return False
+        error_match = ERROR_INDICATOR_PATTERN.search(content, 0, ERROR_SCAN_SIZE)
+        if error_match:
+            self.logger.warning(f"Error indicator found in content: {error_match.group().decode().lower()}")
+            return False
         
         # Check for minimal content length
         if len(content) < 100:
-            self.logger.warning(f"Content too short: {len(content)} characters")
+            self.logger.warning(f"Content too short: {len(content)} bytes")
             return False
         
         # Check for HTML structure
-        if not any(tag in content for tag in ['<html', '<body', '<div', '<table']):
+        if not HTML_STRUCTURE_PATTERN.search(content, 0, STRUCTURE_SCAN_SIZE):
             self.logger.warning("No HTML structure found in content")
             return False
         
@@ -692,8 +1348,8 @@ class MahkamahAgungScraper:
                 
                 elif choice == '3':
                     filename = f"debug_response_{int(time.time())}.html"
-                    with open(filename, 'w', encoding='utf-8') as f:
-                        f.write(response.text)
+                    with open(filename, 'wb') as f:
+                        f.write(response.content)
                     print(f"Response saved to: {filename}")
                 
                 elif choice == '4':
@@ -726,7 +1382,7 @@ class MahkamahAgungScraper:
     
     def _test_selectors_interactive(self, html_content: str):
         """Test CSS selectors interactively"""
-        soup = BeautifulSoup(html_content, 'lxml')
+        tree = _parse_document(html_content)
         
         print("\n🎯 SELECTOR TESTING MODE")
         print("Enter CSS selectors to test (or 'back' to return)")
@@ -742,16 +1398,16 @@ class MahkamahAgungScraper:
                 if not selector:
                     continue
                 
-                elements = soup.select(selector)
+                elements = _compiled_selector(selector)(tree)
                 print(f"\nFound {len(elements)} elements with selector '{selector}'")
                 
                 if elements:
                     print("First 3 elements:")
                     for i, elem in enumerate(elements[:3]):
-                        print(f"  {i+1}. Tag: {elem.name}")
-                        print(f"     Classes: {elem.get('class', [])}")
+                        print(f"  {i+1}. Tag: {elem.tag}")
+                        print(f"     Classes: {elem.get('class', '').split()}")
                         print(f"     ID: {elem.get('id', 'None')}")
-                        text_preview = elem.get_text(strip=True)[:100]
+                        text_preview = _visible_text(elem, strip=True)[:100]
                         print(f"     Text: {text_preview}...")
                         print()
                 
@@ -761,41 +1417,47 @@ class MahkamahAgungScraper:
     def parse_putusan_list(self, html_content: str) -> List[Dict]:
         """Parse putusan list based on actual HTML structure from Mahkamah Agung"""
         try:
-            soup = BeautifulSoup(html_content, 'lxml')
             putusan_list = []
             
+            # One timestamp string shared by every record on the page
+            scraped_at = datetime.now().isoformat()
+            
+            tree = _parse_document(html_content)
+            
             # Based on the HTML structure, putusan data is in div.spost elements
-            putusan_elements = soup.select('div.spost')
+            putusan_elements = SPOST_SELECTOR(tree)
             
-            if not putusan_elements:
+            if putusan_elements:
+                self.logger.info(f"Found {len(putusan_elements)} putusan elements")
+                for element in putusan_elements:
+                    self._append_putusan(putusan_list, element, scraped_at)
+            else:
                 self.logger.warning("No putusan elements found with div.spost selector")
-                # Try alternative selectors based on the HTML structure
-                alternative_selectors = [
-                    '#popular-post-list-sidebar div.spost',
-                    '.spost',
-                    'div[class*="spost"]'
-                ]
                 
-                for selector in alternative_selectors:
-                    putusan_elements = soup.select(selector)
+                # Try alternative selectors based on the HTML structure, starting
+                # with the one that matched on an earlier page
+                alternatives = ALTERNATIVE_SPOST_SELECTORS
+                if self._learned_spost_selector is not None:
+                    alternatives = [self._learned_spost_selector] + [
+                        alternative for alternative in alternatives
+                        if alternative is not self._learned_spost_selector
+                    ]
+                
+                putusan_elements = []
+                for alternative in alternatives:
+                    selector, matcher = alternative
+                    putusan_elements = matcher(tree)
                     if putusan_elements:
                         self.logger.info(f"Found {len(putusan_elements)} elements with selector: {selector}")
+                        self._learned_spost_selector = alternative
                         break
-            
-            if not putusan_elements:
-                self.logger.warning("No putusan elements found with any selector")
-                return []
-            
-            self.logger.info(f"Found {len(putusan_elements)} putusan elements")
-            
-            for element in putusan_elements:
-                try:
-                    putusan_data = self._extract_putusan_from_spost(element)
-                    if putusan_data:
-                        putusan_list.append(putusan_data)
-                except Exception as e:
-                    self.logger.warning(f"Error extracting data from element: {e}")
-                    continue
+                
+                if not putusan_elements:
+                    self.logger.warning("No putusan elements found with any selector")
+                    return []
+                
+                for element in putusan_elements:
+                    self._append_putusan(putusan_list, element, scraped_at)
             
             self.logger.info(f"Successfully parsed {len(putusan_list)} putusan records")
             return putusan_list
@@ -804,89 +1466,127 @@ class MahkamahAgungScraper:
             self.logger.error(f"Error parsing HTML content: {e}")
             return []
     
-    def _extract_putusan_from_spost(self, element) -> Optional[Dict]:
+    def _append_putusan(self, putusan_list: List[Dict], element, scraped_at: str):
+        """Extract one putusan element and append the record if it has data"""
+        try:
+            putusan_data = self._extract_putusan_from_spost(element, scraped_at)
+            if putusan_data:
+                putusan_list.append(putusan_data)
+        except Exception as e:
+            self.logger.warning(f"Error extracting data from element: {e}")
+    
+    def _extract_putusan_from_spost(self, element, scraped_at: Optional[str] = None) -> Optional[Dict]:
         """Extract putusan data from spost element based on actual HTML structure"""
         try:
             putusan_data = {}
             
+            # Collect everything in one walk over the subtree instead of one
+            # selector pass per field
+            small_divs = []
+            title_link = None
+            icon_elements = []
+            abstract_div = None
+            
+            for child in element.iter(etree.Element):
+                tag = child.tag
+                if tag == 'div':
+                    classes = child.get('class', '').split()
+                    if 'small' in classes:
+                        small_divs.append(child)
+                    if abstract_div is None and 'putusan_container' in classes:
+                        abstract_div = child
+                elif tag == 'strong':
+                    if title_link is None:
+                        title_link = next(child.iter('a'), None)
+                elif tag == 'i':
+                    classes = child.get('class', '').split()
+                    if 'icon-eye' in classes or 'icon-download' in classes:
+                        icon_elements.append(child)
+            
             # Extract breadcrumb/category path
-            small_divs = element.select('div.small')
             if small_divs:
-                breadcrumb_text = small_divs[0].get_text(strip=True)
+                breadcrumb_text = _element_text(small_divs[0], strip=True)
                 putusan_data['breadcrumb'] = clean_text(breadcrumb_text)
                 
                 # Parse category from breadcrumb
                 if 'Pengadilan' in breadcrumb_text:
                     parts = [part.strip() for part in breadcrumb_text.split('>')[-3:]]
                     if len(parts) >= 2:
-                        putusan_data['pengadilan'] = clean_text(parts[0])
-                        putusan_data['kategori'] = clean_text(parts[1])
+                        # Court and category names repeat across thousands of
+                        # records, so keep a single copy of each string
+                        putusan_data['pengadilan'] = sys.intern(clean_text(parts[0]))
+                        putusan_data['kategori'] = sys.intern(clean_text(parts[1]))
                         if len(parts) >= 3:
-                            putusan_data['sub_kategori'] = clean_text(parts[2])
+                            putusan_data['sub_kategori'] = sys.intern(clean_text(parts[2]))
             
             # Extract dates (Register, Putus, Upload)
             if len(small_divs) > 1:
-                date_text = small_divs[1].get_text(strip=True)
+                date_text = _element_text(small_divs[1], strip=True)
                 dates = self._parse_dates_from_text(date_text)
                 putusan_data.update(dates)
             
             # Extract main title/link
-            title_link = element.select('strong a')
-            if title_link:
-                putusan_data['title'] = clean_text(title_link[0].get_text(strip=True))
-                putusan_data['link'] = normalize_url(title_link[0].get('href', ''), BASE_URL)
+            if title_link is not None:
+                putusan_data['title'] = clean_text(_element_text(title_link, strip=True))
+                putusan_data['link'] = normalize_url(title_link.get('href', ''), BASE_URL)
                 
                 # Extract nomor putusan from title
-                nomor_match = re.search(r'Nomor\s+([^<\n]+)', putusan_data['title'])
+                nomor_match = NOMOR_PATTERN.search(putusan_data['title'])
                 if nomor_match:
                     putusan_data['nomor'] = clean_text(nomor_match.group(1))
             
-            # Extract case details
-            case_info_divs = element.select('div')
-            for div in case_info_divs:
-                text = div.get_text(strip=True)
+            # Extract case details. The last matching div wins, so walk the
+            # candidates backwards and stop once both fields are settled
+            outer = set(element.iterancestors())
+            outer.add(element)
+            case_info_divs = [div for div in CASE_DETAIL_DIVS(element) if div not in outer]
+            
+            for div in reversed(case_info_divs):
+                text = _element_text(div, strip=True)
                 if '—' in text and any(keyword in text for keyword in ['Tanggal', 'VS', 'vs']):
-                    putusan_data['case_details'] = clean_text(text)
+                    if 'case_details' not in putusan_data:
+                        putusan_data['case_details'] = clean_text(text)
                     
                     # Extract parties
                     if ' VS ' in text or ' vs ' in text:
-                        parts = re.split(r'\s+(?:VS|vs)\s+', text)
+                        parts = PARTIES_SPLIT_PATTERN.split(text)
                         if len(parts) >= 2:
                             putusan_data['penggugat'] = clean_text(parts[0].split('—')[-1])
                             putusan_data['tergugat'] = clean_text(parts[1])
+                            break
             
             # Extract view and download counts
-            icon_elements = element.select('i.icon-eye, i.icon-download')
             for icon in icon_elements:
-                next_strong = icon.find_next_sibling('strong')
-                if next_strong:
-                    count_text = next_strong.get_text(strip=True)
+                next_strong = next(icon.itersiblings('strong'), None)
+                if next_strong is not None:
+                    count_text = _element_text(next_strong, strip=True)
                     try:
                         count = int(count_text)
-                        if 'icon-eye' in icon.get('class', []):
+                        icon_classes = icon.get('class', '').split()
+                        if 'icon-eye' in icon_classes:
                             putusan_data['view_count'] = count
-                        elif 'icon-download' in icon.get('class', []):
+                        elif 'icon-download' in icon_classes:
                             putusan_data['download_count'] = count
                     except ValueError:
                         pass
             
             # Check for final status
-            if 'Berkekuatan Hukum Tetap' in element.get_text():
+            element_text = _element_text(element)
+            if 'Berkekuatan Hukum Tetap' in element_text:
                 putusan_data['status'] = 'Berkekuatan Hukum Tetap'
             
             # Check for unpublish status
-            if 'Unpublish' in element.get_text():
+            if 'Unpublish' in element_text:
                 putusan_data['status'] = 'Unpublish'
             
             # Extract abstract if available
-            abstract_div = element.select('div.putusan_container')
-            if abstract_div:
-                abstract_text = abstract_div[0].get_text(strip=True)
+            if abstract_div is not None:
+                abstract_text = _element_text(abstract_div, strip=True)
                 if abstract_text:
                     putusan_data['abstract'] = clean_text(abstract_text)
             
             # Add metadata
-            putusan_data['scraped_at'] = datetime.now().isoformat()
+            putusan_data['scraped_at'] = scraped_at or datetime.now().isoformat()
             putusan_data['source'] = 'mahkamahagung.go.id'
             
             return putusan_data if putusan_data else None
@@ -899,15 +1599,8 @@ class MahkamahAgungScraper:
         """Parse dates from text like 'Register : 17-04-2025 — Putus : 13-06-2025 — Upload : 06-08-2025'"""
         dates = {}
         
-        # Patterns for different date types
-        date_patterns = {
-            'tanggal_register': r'Register\s*:\s*([0-9\-/]+)',
-            'tanggal_putus': r'Putus\s*:\s*([0-9\-/]+)',
-            'tanggal_upload': r'Upload\s*:\s*([0-9\-/]+)'
-        }
-        
-        for field, pattern in date_patterns.items():
-            match = re.search(pattern, date_text)
+        for field, pattern in DATE_FIELD_PATTERNS.items():
+            match = pattern.search(date_text)
             if match:
                 date_str = match.group(1)
                 dates[field] = clean_text(date_str)
@@ -924,21 +1617,25 @@ class MahkamahAgungScraper:
     
     def _parse_date_string(self, date_str: str) -> Optional[datetime]:
         """Parse various date formats"""
-        date_formats = [
-            '%d-%m-%Y',
-            '%d/%m/%Y',
-            '%Y-%m-%d',
-            '%d-%m-%y',
-            '%d/%m/%y'
-        ]
+        match = DATE_STRING_PATTERN.fullmatch(date_str.strip())
+        if not match:
+            return None
         
-        for fmt in date_formats:
-            try:
-                return datetime.strptime(date_str.strip(), fmt)
-            except ValueError:
-                continue
+        if match.group('day'):
+            year = int(match.group('year'))
+            if len(match.group('year')) == 2:
+                # Same pivot as strptime's %y: 69-99 -> 1900s, 00-68 -> 2000s
+                year += 1900 if year >= 69 else 2000
+            day, month = match.group('day'), match.group('month')
+        else:
+            year = int(match.group('iso_year'))
+            day, month = match.group('iso_day'), match.group('iso_month')
         
-        return None
+        try:
+            return datetime(year, int(month), int(day))
+        except ValueError:
+            # Out of range, e.g. 31-02-2025
+            return None
     
     def download_putusan_file(self, putusan_data: Dict, download_pdf: bool = True) -> Dict:
         """Download PDF/ZIP file for a putusan"""
@@ -956,8 +1653,8 @@ class MahkamahAgungScraper:
                 return putusan_data
             
             # Parse detail page to find download links
-            detail_soup = BeautifulSoup(detail_content, 'lxml')
-            download_links = self._extract_download_links(detail_soup)
+            detail_tree = _parse_document(detail_content)
+            download_links = self._extract_download_links(detail_tree)
             
             if not download_links:
                 self.logger.info(f"No download links found for {putusan_data.get('nomor', 'unknown')}")
@@ -966,15 +1663,16 @@ class MahkamahAgungScraper:
             # Download files
             for link_info in download_links:
                 if download_pdf or link_info['type'] != 'pdf':
-                    file_path = self._download_file(link_info, putusan_data)
-                    if file_path:
+                    downloaded = self._download_file(link_info, putusan_data)
+                    if downloaded:
+                        file_path, file_size = downloaded
                         if 'downloaded_files' not in putusan_data:
                             putusan_data['downloaded_files'] = []
                         putusan_data['downloaded_files'].append({
                             'type': link_info['type'],
                             'url': link_info['url'],
                             'file_path': file_path,
-                            'file_size': os.path.getsize(file_path) if os.path.exists(file_path) else 0
+                            'file_size': file_size
                         })
             
         except Exception as e:
@@ -982,56 +1680,39 @@ class MahkamahAgungScraper:
         
         return putusan_data
     
-    def _extract_download_links(self, soup: BeautifulSoup) -> List[Dict]:
+    def _extract_download_links(self, tree) -> List[Dict]:
         """Extract download links from detail page"""
         download_links = []
-        
-        # Look for download buttons/links
-        download_selectors = [
-            'a[href*=".pdf"]',
-            'a[href*=".zip"]',
-            'a[href*="download"]',
-            'button[onclick*="download"]',
-            '.download-btn',
-            '.btn-download'
-        ]
-        
-        for selector in download_selectors:
-            elements = soup.select(selector)
-            for element in elements:
-                href = element.get('href')
-                onclick = element.get('onclick', '')
-                
-                # Extract URL from href or onclick
-                download_url = None
-                if href and (href.endswith('.pdf') or href.endswith('.zip') or 'download' in href):
-                    download_url = normalize_url(href, BASE_URL)
-                elif onclick:
-                    # Extract URL from onclick javascript
-                    url_match = re.search(r'["\']([^"\']*\.(?:pdf|zip)[^"\']*)["\']', onclick)
-                    if url_match:
-                        download_url = normalize_url(url_match.group(1), BASE_URL)
-                
-                if download_url:
-                    file_type = 'pdf' if '.pdf' in download_url.lower() else 'zip'
-                    download_links.append({
-                        'url': download_url,
-                        'type': file_type,
-                        'text': element.get_text(strip=True)
-                    })
-        
-        # Remove duplicates
         seen_urls = set()
-        unique_links = []
-        for link in download_links:
-            if link['url'] not in seen_urls:
-                seen_urls.add(link['url'])
-                unique_links.append(link)
         
-        return unique_links
+        # Look for download buttons/links (document order, first one per URL wins)
+        for element in DOWNLOAD_LINK_SELECTOR(tree):
+            href = element.get('href')
+            onclick = element.get('onclick', '')
+            
+            # Extract URL from href or onclick
+            download_url = None
+            if href and (href.endswith('.pdf') or href.endswith('.zip') or 'download' in href):
+                download_url = normalize_url(href, BASE_URL)
+            elif onclick:
+                # Extract URL from onclick javascript
+                url_match = ONCLICK_URL_PATTERN.search(onclick)
+                if url_match:
+                    download_url = normalize_url(url_match.group(1), BASE_URL)
+            
+            if download_url and download_url not in seen_urls:
+                seen_urls.add(download_url)
+                file_type = 'pdf' if '.pdf' in download_url.lower() else 'zip'
+                download_links.append({
+                    'url': download_url,
+                    'type': file_type,
+                    'text': _visible_text(element, strip=True)
+                })
+        
+        return download_links
     
-    def _download_file(self, link_info: Dict, putusan_data: Dict) -> Optional[str]:
-        """Download a single file (PDF or ZIP)"""
+    def _download_file(self, link_info: Dict, putusan_data: Dict) -> Optional[Tuple[str, int]]:
+        """Download a single file (PDF or ZIP), returning its path and size"""
         try:
             url = link_info['url']
             file_type = link_info['type']
@@ -1039,7 +1720,7 @@ class MahkamahAgungScraper:
             # Create filename
             nomor = putusan_data.get('nomor', 'unknown')
             # Clean nomor for filename
-            safe_nomor = re.sub(r'[^\w\-_.]', '_', nomor)
+            safe_nomor = UNSAFE_FILENAME_PATTERN.sub('_', nomor)
             filename = f"{safe_nomor}.{file_type}"
             
             # Create subdirectory based on type
@@ -1048,16 +1729,46 @@ class MahkamahAgungScraper:
             
             file_path = os.path.join(type_dir, filename)
             
-            # Skip if file already exists
-            if os.path.exists(file_path):
+            try:
+                local_size = os.stat(file_path).st_size
+            except FileNotFoundError:
+                local_size = 0
+            
+            # Compare a local copy with the remote file before fetching it
+            # (with no local copy the GET below is all that's needed)
+            remote = self._head_download(url) if local_size else {}
+            remote_size = int(remote.get('content-length') or 0)
+            validator = remote.get('etag') or remote.get('last-modified')
+            
+            with self._download_stats_lock:
+                cached_validator = self._download_validators.get(url)
+            unchanged = not validator or not cached_validator or validator == cached_validator
+            
+            # Skip if file already exists (complete, or its size can't be checked)
+            if local_size and unchanged and (not remote_size or local_size == remote_size):
                 self.logger.info(f"File already exists: {file_path}")
-                return file_path
-            
-            # Download file
-            self.logger.info(f"Downloading {file_type.upper()}: {url}")
+                return file_path, local_size
+            
+            # Download file, resuming a partial copy only when it is known to
+            # come from the same remote version. If-Range makes the server
+            # send the whole file if it changed since
+            headers = {}
+            if 0 < local_size < remote_size and cached_validator and validator == cached_validator:
+                headers = {'Range': f'bytes={local_size}-', 'If-Range': cached_validator}
+                self.logger.info(f"Resuming {file_type.upper()} at byte {local_size}: {url}")
+            else:
+                self.logger.info(f"Downloading {file_type.upper()}: {url}")
             
-            response = self.session.get(url, timeout=60, stream=True)
+            self.rate_limiter.acquire()
+            response = self.session.get(url, timeout=60, stream=True, headers=headers)
             response.raise_for_status()
+            mode = 'ab' if response.status_code == 206 else 'wb'
+            
+            # Remembered before writing, so an interrupted download can resume
+            if mode == 'wb':
+                validator = response.headers.get('etag') or response.headers.get('last-modified')
+                if validator:
+                    self._remember_download_validator(url, validator)
             
             # Check content type
             content_type = response.headers.get('content-type', '').lower()
@@ -1067,29 +1778,30 @@ class MahkamahAgungScraper:
             # Download with progress
             total_size = int(response.headers.get('content-length', 0))
             
-            with open(file_path, 'wb') as f:
+            # Let urllib3 undo any Content-Encoding while copying
+            response.raw.decode_content = True
+            
+            with open(file_path, mode) as f:
                 if total_size > 0:
                     with tqdm(total=total_size, unit='B', unit_scale=True, desc=f"Downloading {filename}") as pbar:
-                        for chunk in response.iter_content(chunk_size=8192):
-                            if chunk:
-                                f.write(chunk)
-                                pbar.update(len(chunk))
+                        stream = CallbackIOWrapper(pbar.update, response.raw, 'read')
+                        shutil.copyfileobj(stream, f, DOWNLOAD_CHUNK_SIZE)
                 else:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
+                    shutil.copyfileobj(response.raw, f, DOWNLOAD_CHUNK_SIZE)
+                # Position after the last write is the file size (resumes included)
+                file_size = f.tell()
             
             # Verify download
-            if os.path.exists(file_path) and os.path.getsize(file_path) > 0:
-                file_size = os.path.getsize(file_path)
+            if file_size > 0:
                 self.logger.info(f"Successfully downloaded {filename} ({file_size} bytes)")
                 
                 # Update stats
-                if file_type == 'pdf':
-                    self.download_stats['pdf_downloads'] += 1
-                elif file_type == 'zip':
-                    self.download_stats['zip_downloads'] += 1
-                self.download_stats['total_size'] += file_size
+                with self._download_stats_lock:
+                    if file_type == 'pdf':
+                        self.download_stats['pdf_downloads'] += 1
+                    elif file_type == 'zip':
+                        self.download_stats['zip_downloads'] += 1
+                    self.download_stats['total_size'] += file_size
                 
                 # Verify file integrity
                 if file_type == 'zip':
@@ -1097,28 +1809,54 @@ class MahkamahAgungScraper:
                 elif file_type == 'pdf':
                     self._verify_pdf_file(file_path)
                 
-                return file_path
+                return file_path, file_size
             else:
-                self.logger.error(f"Downloaded file is empty or missing: {file_path}")
+                self.logger.error(f"Downloaded file is empty: {file_path}")
                 return None
                 
         except Exception as e:
             self.logger.error(f"Error downloading file {url}: {e}")
-            self.download_stats['failed_downloads'] += 1
+            with self._download_stats_lock:
+                self.download_stats['failed_downloads'] += 1
             return None
     
+    def _head_download(self, url: str) -> Dict:
+        """Headers of a HEAD request for url (empty if the server won't answer one)"""
+        try:
+            self.rate_limiter.acquire()
+            response = self.session.head(url, timeout=30, allow_redirects=True)
+            if response.ok:
+                return response.headers
+        except requests.RequestException as e:
+            self.logger.debug(f"HEAD request failed for {url}: {e}")
+        return {}
+    
+    def _load_download_validators(self) -> Dict[str, str]:
+        """Load the ETag/Last-Modified sidecar written by earlier downloads"""
+        try:
+            with open(self._download_validators_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _remember_download_validator(self, url: str, validator: str):
+        """Record the validator of a download and persist the sidecar"""
+        with self._download_stats_lock:
+            self._download_validators[url] = validator
+            write_json(self._download_validators_file, self._download_validators)
+    
     def _verify_zip_file(self, file_path: str) -> bool:
         """Verify ZIP file integrity"""
         try:
+            # Opening the archive reads the central directory; members are not
+            # decompressed here, their CRCs are checked whenever they're extracted
             with zipfile.ZipFile(file_path, 'r') as zip_ref:
-                # Test the ZIP file
-                bad_file = zip_ref.testzip()
-                if bad_file:
-                    self.logger.warning(f"Corrupt file in ZIP: {bad_file}")
+                file_list = zip_ref.namelist()
+                if not file_list:
+                    self.logger.warning(f"ZIP file is empty: {file_path}")
                     return False
                 
                 # List contents
-                file_list = zip_ref.namelist()
                 self.logger.debug(f"ZIP contains {len(file_list)} files: {file_list[:5]}")
                 return True
                 
@@ -1132,18 +1870,22 @@ class MahkamahAgungScraper:
     def _verify_pdf_file(self, file_path: str) -> bool:
         """Verify PDF file integrity"""
         try:
-            # Basic PDF header check
             with open(file_path, 'rb') as f:
-                header = f.read(4)
-                if header != b'%PDF':
-                    self.logger.warning(f"File does not appear to be a PDF: {file_path}")
+                # Check file size
+                file_size = os.fstat(f.fileno()).st_size
+                if file_size < 1024:  # Less than 1KB is suspicious
+                    self.logger.warning(f"PDF file suspiciously small: {file_size} bytes")
                     return False
-            
-            # Check file size
-            file_size = os.path.getsize(file_path)
-            if file_size < 1024:  # Less than 1KB is suspicious
-                self.logger.warning(f"PDF file suspiciously small: {file_size} bytes")
-                return False
+                
+                # Header and trailer checks only touch the first and last pages of the file
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if mm[:4] != b'%PDF':
+                        self.logger.warning(f"File does not appear to be a PDF: {file_path}")
+                        return False
+                    
+                    if mm.rfind(b'%%EOF', file_size - 1024) == -1:
+                        self.logger.warning(f"PDF file has no %%EOF trailer (truncated?): {file_path}")
+                        return False
             
             return True
             
@@ -1164,11 +1906,17 @@ class MahkamahAgungScraper:
         # Download files for each putusan
         self.logger.info(f"Starting file downloads for {len(scraped_data)} putusan...")
         
-        with tqdm(desc="Downloading files", total=len(scraped_data)) as pbar:
-            for i, putusan in enumerate(scraped_data):
+        with tqdm(desc="Downloading files", total=len(scraped_data)) as pbar, \
+                ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+            futures = {
+                executor.submit(self.download_putusan_file, putusan, download_pdf_only): i
+                for i, putusan in enumerate(scraped_data)
+            }
+            
+            for future in as_completed(futures):
+                i = futures[future]
                 try:
-                    updated_putusan = self.download_putusan_file(putusan, download_pdf_only)
-                    scraped_data[i] = updated_putusan
+                    scraped_data[i] = future.result()
                     
                     pbar.set_postfix({
                         'PDF': self.download_stats['pdf_downloads'],
@@ -1180,9 +1928,6 @@ class MahkamahAgungScraper:
                     self.logger.error(f"Error processing putusan {i}: {e}")
                 
                 pbar.update(1)
-                
-                # Rate limiting for downloads
-                self._random_delay((1, 3))
         
         # Log download statistics
         self.logger.info(f"Download completed. Stats: {self.download_stats}")
@@ -1199,6 +1944,17 @@ class MahkamahAgungScraper:
             'average_file_size': self.download_stats['total_size'] / max(total_downloads, 1)
         }
     
+    def _add_scraped_data(self, records: List[Dict], key_field: str = "nomor") -> int:
+        """Append records to scraped_data, dropping duplicates like deduplicate_data does"""
+        added = 0
+        for record in records:
+            key = record.get(key_field, "")
+            if key and key not in self._seen_keys:
+                self._seen_keys.add(key)
+                self.scraped_data.append(record)
+                added += 1
+        return added
+    
     def scrape_pages(self, start_page: int = 1, max_pages: Optional[int] = None, 
                     resume_from_checkpoint: bool = True) -> List[Dict]:
         """
@@ -1210,25 +1966,37 @@ class MahkamahAgungScraper:
             if checkpoint:
                 self.logger.info(f"Resuming from checkpoint: page {checkpoint['last_page']}")
                 start_page = checkpoint['last_page'] + 1
-                self.scraped_data = checkpoint.get('data', [])
+                self.scraped_data = []
+                self._seen_keys = set()
+                self._add_scraped_data(checkpoint.get('data', []))
         
         progress_tracker = ProgressTracker(max_pages or 100)
         current_page = start_page
+        next_page = start_page
+        # (page, future) pairs being fetched, in page order
+        pending = deque()
         
         try:
-            with tqdm(desc="Scraping pages", unit="page") as pbar:
+            with tqdm(desc="Scraping pages", unit="page") as pbar, \
+                    ThreadPoolExecutor(max_workers=PAGE_FETCH_WORKERS) as executor:
                 while True:
-                    if max_pages and current_page > max_pages:
+                    # Keep PAGE_FETCH_WORKERS pages in flight so the next
+                    # pages download while the current one is parsed
+                    while len(pending) < PAGE_FETCH_WORKERS and not (max_pages and next_page > max_pages):
+                        page_url = f"{DIREKTORI_URL}?page={next_page}"
+                        self.logger.info(f"Scraping page {next_page}: {page_url}")
+                        pending.append((next_page, executor.submit(self.get_page_content, page_url, 'auto')))
+                        next_page += 1
+                    
+                    if not pending:
                         break
                     
-                    # Construct URL
-                    page_url = f"{DIREKTORI_URL}?page={current_page}"
-                    self.logger.info(f"Scraping page {current_page}: {page_url}")
+                    page, future = pending.popleft()
+                    content = future.result()
+                    current_page = page
                     
-                    # Get page content
-                    content = self.get_page_content(page_url, method='auto')
                     if not content:
-                        self.logger.warning(f"Failed to get content for page {current_page}")
+                        self.logger.warning(f"Failed to get content for page {page}")
                         current_page += 1
                         continue
                     
@@ -1236,14 +2004,16 @@ class MahkamahAgungScraper:
                     page_data = self.parse_putusan_list(content)
                     
                     if not page_data:
-                        self.logger.info(f"No data found on page {current_page}, might be end of pages")
+                        self.logger.info(f"No data found on page {page}, might be end of pages")
+                        for _, future in pending:
+                            future.cancel()
                         break
                     
-                    # Add to scraped data
-                    self.scraped_data.extend(page_data)
+                    # Add to scraped data, skipping putusan already seen on earlier pages
+                    self._add_scraped_data(page_data)
                     
                     # Update progress
-                    progress_tracker.update(current_page, len(self.scraped_data))
+                    progress_tracker.update(page, len(self.scraped_data))
                     stats = progress_tracker.get_stats()
                     
                     # Update progress bar
@@ -1255,14 +2025,11 @@ class MahkamahAgungScraper:
                     })
                     
                     # Save checkpoint setiap 10 halaman
-                    if current_page % 10 == 0:
-                        save_checkpoint(self.scraped_data, current_page, max_pages or current_page + 100)
-                        self.logger.info(f"Checkpoint saved at page {current_page}")
+                    if page % 10 == 0:
+                        save_checkpoint(self.scraped_data, page, max_pages or page + 100)
+                        self.logger.info(f"Checkpoint saved at page {page}")
                     
                     current_page += 1
-                    
-                    # Rate limiting delay
-                    self._random_delay()
         
         except KeyboardInterrupt:
             self.logger.info("Scraping interrupted by user")
@@ -1276,9 +2043,6 @@ class MahkamahAgungScraper:
             # Final cleanup
             self.cleanup()
         
-        # Deduplicate data
-        self.scraped_data = deduplicate_data(self.scraped_data)
-        
         self.logger.info(f"Scraping completed. Total data: {len(self.scraped_data)}")
         return self.scraped_data
     
@@ -1294,27 +2058,75 @@ class MahkamahAgungScraper:
         
         if format == 'json':
             filepath = os.path.join(PROCESSED_DATA_DIR, f"{filename}.json")
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(self.scraped_data, f, indent=JSON_INDENT, ensure_ascii=False)
+            write_json(filepath, self.scraped_data, indent=JSON_INDENT)
         
-        elif format == 'csv':
-            import pandas as pd
-            filepath = os.path.join(PROCESSED_DATA_DIR, f"{filename}.csv")
-            df = pd.DataFrame(self.scraped_data)
-            df.to_csv(filepath, index=False, encoding=CSV_ENCODING)
+        elif format in ('csv', 'parquet'):
+            # Stream through pyarrow in batches instead of building a DataFrame
+            filepath = os.path.join(PROCESSED_DATA_DIR, f"{filename}.{format}")
+            self._write_arrow(filepath, format)
         
         elif format == 'excel':
             import pandas as pd
+            df = pd.DataFrame.from_records(self.scraped_data)
             filepath = os.path.join(PROCESSED_DATA_DIR, f"{filename}.xlsx")
-            df = pd.DataFrame(self.scraped_data)
-            df.to_excel(filepath, index=False)
+            # xlsxwriter is much faster than openpyxl when it is installed
+            engine = 'xlsxwriter' if importlib.util.find_spec('xlsxwriter') else None
+            df.to_excel(filepath, index=False, engine=engine)
         
         self.logger.info(f"Data saved to {filepath}")
         
         # Save stats
         stats_file = os.path.join(PROCESSED_DATA_DIR, f"{filename}_stats.json")
-        with open(stats_file, 'w', encoding='utf-8') as f:
-            json.dump(self.stats, f, indent=2, ensure_ascii=False)
+        write_json(stats_file, self.stats)
+    
+    def _write_arrow(self, filepath: str, format: str):
+        """Write scraped_data as CSV or Parquet, EXPORT_BATCH_SIZE records at a time"""
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+        import pyarrow.parquet as pa_parquet
+        
+        # Columns in order of first appearance, as pandas.DataFrame.from_records does
+        columns = list(dict.fromkeys(key for record in self.scraped_data for key in record))
+        
+        def columns_of(batch: List[Dict]) -> Dict[str, list]:
+            values = {column: [record.get(column) for record in batch] for column in columns}
+            if format == 'csv':
+                # CSV has no nested types; write lists/dicts (e.g. downloaded_files)
+                # as text, and booleans as True/False like pandas does
+                for column, column_values in values.items():
+                    if any(isinstance(value, (list, dict, bool)) for value in column_values):
+                        values[column] = [None if value is None else str(value) for value in column_values]
+            return values
+        
+        batches = [
+            self.scraped_data[i:i + EXPORT_BATCH_SIZE]
+            for i in range(0, len(self.scraped_data), EXPORT_BATCH_SIZE)
+        ]
+        
+        # Each batch is converted once; column types can differ per batch
+        # (e.g. all-null in one), so they are cast to the unified schema
+        tables = [pa.Table.from_pydict(columns_of(batch)) for batch in batches]
+        schema = pa.unify_schemas([table.schema for table in tables], promote_options='permissive')
+        tables = [table.cast(schema) for table in tables]
+        
+        if format == 'csv':
+            # pyarrow only writes UTF-8, so render each batch and re-encode it
+            # to CSV_ENCODING (the incremental encoder writes a BOM only once)
+            encoder = codecs.getincrementalencoder(CSV_ENCODING)()
+            with open(filepath, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                for i, table in enumerate(tables):
+                    buffer = pa.BufferOutputStream()
+                    pa_csv.write_csv(
+                        table, buffer,
+                        write_options=pa_csv.WriteOptions(include_header=i == 0, quoting_style='needed')
+                    )
+                    f.write(encoder.encode(buffer.getvalue().to_pybytes().decode('utf-8')))
+                f.write(encoder.encode('', final=True))
+            return
+        
+        with pa_parquet.ParquetWriter(filepath, schema, compression=PARQUET_COMPRESSION) as writer:
+            for table in tables:
+                writer.write_table(table)
     
     def get_stats(self) -> Dict:
         """Get scraping statistics"""
@@ -1330,11 +2142,12 @@ class MahkamahAgungScraper:
         if self.session:
             self.session.close()
         
-        if self.driver:
-            try:
-                self.driver.quit()
-            except Exception as e:
-                self.logger.warning(f"Error closing driver: {e}")
+        if self._dns_cache_installed:
+            uninstall_dns_cache()
+            self._dns_cache_installed = False
+        
+        self._quit_all_drivers()
+        self._stop_debug_writer()
 
 
 def debug_site_structure(url: str = None):
@@ -1398,6 +2211,7 @@ def main():
     parser.add_argument('--download', action='store_true', help='Download PDF/ZIP files')
     parser.add_argument('--download-all', action='store_true', help='Download both PDF and ZIP files')
     parser.add_argument('--no-pdf', action='store_true', help='Skip PDF downloads (only ZIP)')
+    parser.add_argument('--cache', action='store_true', help='Reuse pages fetched by earlier runs from the on-disk cache')
     
     args = parser.parse_args()
     
@@ -1405,7 +2219,8 @@ def main():
         debug_site_structure(args.url)
         return
     
-    scraper = MahkamahAgungScraper(debug=args.debug, interactive_debug=args.interactive)
+    scraper = MahkamahAgungScraper(debug=args.debug, interactive_debug=args.interactive,
+                                   use_disk_cache=args.cache)
     
     try:
         # Test basic connectivity
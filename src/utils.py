@@ -2,13 +2,35 @@
 Utility functions untuk scraper Mahkamah Agung
 """
 
+import functools
 import os
 import re
+import json
 import logging
+import threading
+import time
 from datetime import datetime
-from typing import List, Dict, Optional, Union
+from typing import Any, Callable, List, Dict, Optional, Union
 from urllib.parse import urljoin, urlparse
 
+from config import WRITE_BUFFER_SIZE
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional, fall back to the stdlib encoder
+    orjson = None
+
+# Pola regex yang dipakai per record, dikompilasi sekali saat import
+DATE_PATTERNS = [
+    re.compile(r'\d{1,2}[-/]\d{1,2}[-/]\d{4}'),
+    re.compile(r'\d{4}[-/]\d{1,2}[-/]\d{1,2}'),
+    re.compile(r'\d{1,2}\s+\w+\s+\d{4}')
+]
+# Path absolut polos (tanpa query/fragment, parameter ';', segmen '.'/'..', atau whitespace):
+# urljoin ke base tanpa path hasilnya sama dengan base + url
+PLAIN_ABSOLUTE_PATH = re.compile(r'(?!//)(?:/(?!\.)[^/?#;\s]*)+')
+
 def setup_directories():
     """Setup direktori yang diperlukan"""
     directories = [
@@ -21,19 +43,37 @@ def setup_directories():
     for directory in directories:
         os.makedirs(directory, exist_ok=True)
 
+def dump_json(data: Any, indent: int = 2, default: Optional[Callable] = None) -> bytes:
+    """Serialisasi data ke JSON (UTF-8 bytes), memakai orjson jika terpasang"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=default, option=option)
+    
+    return json.dumps(data, indent=indent, ensure_ascii=False, default=default).encode('utf-8')
+
+def write_json(filepath: str, data: Any, indent: int = 2, default: Optional[Callable] = None):
+    """Menyimpan data ke file JSON (UTF-8), memakai orjson jika terpasang"""
+    if orjson is not None:
+        with open(filepath, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(dump_json(data, indent, default))
+        return
+    
+    with open(filepath, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+        json.dump(data, f, indent=indent, ensure_ascii=False, default=default)
+
 def clean_text(text: str) -> str:
     """Membersihkan text dari karakter yang tidak diinginkan"""
     if not text:
         return ""
     
-    # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
-    
-    # Remove special characters that might cause issues
-    text = text.replace('\n', ' ').replace('\r', ' ').replace('\t', ' ')
-    
-    return text.strip()
+    # Collapse whitespace runs (newlines and tabs included) and trim the ends;
+    # str.split() matches the same characters as the regex \s
+    return ' '.join(text.split())
 
+# Hasil di-cache: href yang sama (link download, paginasi) muncul berulang kali
+@functools.lru_cache(maxsize=8192)
 def normalize_url(url: str, base_url: str) -> str:
     """Normalize URL untuk memastikan format yang benar"""
     if not url:
@@ -45,6 +85,9 @@ def normalize_url(url: str, base_url: str) -> str:
     
     # Jika relative URL
     if url.startswith('/'):
+        # Base berupa scheme://host saja: cukup digabung, tanpa parsing urljoin
+        if base_url.count('/') == 2 and PLAIN_ABSOLUTE_PATH.fullmatch(url):
+            return base_url + url
         return urljoin(base_url, url)
     
     # Jika URL relatif tanpa slash
@@ -61,13 +104,7 @@ def validate_data(data: Dict) -> bool:
     # Validasi format tanggal jika diperlukan
     if data.get("tanggal"):
         # Basic date validation - bisa diperluas sesuai kebutuhan
-        date_patterns = [
-            r'\d{1,2}[-/]\d{1,2}[-/]\d{4}',
-            r'\d{4}[-/]\d{1,2}[-/]\d{1,2}',
-            r'\d{1,2}\s+\w+\s+\d{4}'
-        ]
-        
-        date_valid = any(re.search(pattern, data["tanggal"]) for pattern in date_patterns)
+        date_valid = any(pattern.search(data["tanggal"]) for pattern in DATE_PATTERNS)
         if not date_valid:
             logging.warning(f"Format tanggal tidak valid: {data['tanggal']}")
     
@@ -86,36 +123,83 @@ def deduplicate_data(data: List[Dict], key_field: str = "nomor") -> List[Dict]:
     
     return unique_data
 
+CHECKPOINT_DIR = "logs/checkpoints"
+CHECKPOINT_DATA_FILE = os.path.join(CHECKPOINT_DIR, "checkpoint.jsonl")
+CHECKPOINT_META_FILE = os.path.join(CHECKPOINT_DIR, "checkpoint.meta.json")
+# Single-JSON checkpoint written by older versions; still read when resuming
+LEGACY_CHECKPOINT_FILE = os.path.join(CHECKPOINT_DIR, "last_checkpoint.json")
+
+# List yang sedang di-checkpoint dan jumlah record yang sudah ada di file JSON-lines
+_checkpoint_state = {"data": None, "flushed": 0}
+
+def _dump_json_line(record: Dict) -> bytes:
+    """Serialisasi satu record menjadi satu baris JSON-lines"""
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS) + b'\n'
+    return json.dumps(record, ensure_ascii=False).encode('utf-8') + b'\n'
+
 def save_checkpoint(data: List[Dict], page_num: int, total_pages: int):
-    """Menyimpan checkpoint untuk resume scraping"""
-    checkpoint_dir = "logs/checkpoints"
-    os.makedirs(checkpoint_dir, exist_ok=True)
+    """Menyimpan checkpoint untuk resume scraping (append-only JSON-lines)"""
+    os.makedirs(CHECKPOINT_DIR, exist_ok=True)
     
-    checkpoint_file = os.path.join(checkpoint_dir, "last_checkpoint.json")
+    # Hanya record baru yang ditulis; list lain (scraping baru) menulis ulang file
+    if _checkpoint_state["data"] is data and _checkpoint_state["flushed"] <= len(data):
+        mode, flushed = 'ab', _checkpoint_state["flushed"]
+    else:
+        mode, flushed = 'wb', 0
+    
+    with open(CHECKPOINT_DATA_FILE, mode, buffering=WRITE_BUFFER_SIZE) as f:
+        for record in data[flushed:]:
+            f.write(_dump_json_line(record))
     
-    checkpoint_data = {
+    _checkpoint_state["data"] = data
+    _checkpoint_state["flushed"] = len(data)
+    
+    # Sidecar kecil ditulis setelah data, jadi data_count selalu sudah ada di file
+    write_json(CHECKPOINT_META_FILE, {
         "last_page": page_num,
         "total_pages": total_pages,
         "data_count": len(data),
-        "timestamp": datetime.now().isoformat(),
-        "data": data
-    }
-    
-    import json
-    with open(checkpoint_file, 'w', encoding='utf-8') as f:
-        json.dump(checkpoint_data, f, indent=2, ensure_ascii=False)
+        "timestamp": datetime.now().isoformat()
+    })
 
 def load_checkpoint() -> Optional[Dict]:
     """Memuat checkpoint terakhir"""
-    checkpoint_file = "logs/checkpoints/last_checkpoint.json"
+    if not os.path.exists(CHECKPOINT_META_FILE) or not os.path.exists(CHECKPOINT_DATA_FILE):
+        return _load_legacy_checkpoint()
     
-    if not os.path.exists(checkpoint_file):
+    try:
+        with open(CHECKPOINT_META_FILE, 'r', encoding='utf-8') as f:
+            checkpoint = json.load(f)
+        
+        with open(CHECKPOINT_DATA_FILE, 'rb') as f:
+            lines = f.readlines()
+        
+        loads = orjson.loads if orjson is not None else json.loads
+        data = [loads(line) for line in lines[:checkpoint["data_count"]]]
+        
+        # Baris setelah data_count berasal dari penulisan yang terputus; file
+        # ditulis ulang pada checkpoint berikutnya
+        _checkpoint_state["data"] = data if len(lines) == len(data) else None
+        _checkpoint_state["flushed"] = len(data)
+        
+        checkpoint["data"] = data
+        return checkpoint
+    except Exception as e:
+        logging.error(f"Error loading checkpoint: {e}")
+        return None
+
+def _load_legacy_checkpoint() -> Optional[Dict]:
+    """Memuat checkpoint format lama (last_checkpoint.json), jika ada"""
+    if not os.path.exists(LEGACY_CHECKPOINT_FILE):
         return None
     
     try:
-        import json
-        with open(checkpoint_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(LEGACY_CHECKPOINT_FILE, 'r', encoding='utf-8') as f:
+            checkpoint = json.load(f)
+        # Checkpoint berikutnya ditulis dalam format baru (file ditulis ulang)
+        logging.info(f"Resuming from legacy checkpoint {LEGACY_CHECKPOINT_FILE}")
+        return checkpoint
     except Exception as e:
         logging.error(f"Error loading checkpoint: {e}")
         return None
@@ -186,3 +270,56 @@ class ProgressTracker:
                 self.start_time, self.current_page, self.total_pages
             )
   }
+
+class RateLimiter:
+    """Token bucket thread-safe untuk membatasi jumlah request per detik
+    
+    Rate turun setengah setiap kali server membalas 429 (tidak di bawah
+    min_rate) dan naik dua kali lipat lagi setelah recovery_streak request
+    berhasil berturut-turut, sampai kembali ke rate awal.
+    """
+    
+    def __init__(self, rate: float, burst: int = 1, min_rate: Optional[float] = None,
+                 recovery_streak: int = 50):
+        self.rate = rate
+        self.max_rate = rate
+        self.min_rate = min_rate if min_rate is not None else rate
+        self.recovery_streak = recovery_streak
+        self.capacity = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.successes = 0
+        self._lock = threading.Lock()
+    
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    def acquire(self):
+        """Menunggu sampai ada token untuk satu request"""
+        with self._lock:
+            self._refill(time.monotonic())
+            # Token diambil sekarang; jika saldo negatif, tunggu sampai terisi
+            self.tokens -= 1
+            wait_time = -self.tokens / self.rate if self.tokens < 0 else 0
+        
+        if wait_time > 0:
+            time.sleep(wait_time)
+    
+    def record_success(self):
+        """Catat request yang berhasil; rate dipulihkan setelah cukup banyak"""
+        with self._lock:
+            self.successes += 1
+            if self.successes >= self.recovery_streak and self.rate < self.max_rate:
+                self._refill(time.monotonic())
+                self.rate = min(self.max_rate, self.rate * 2)
+                self.successes = 0
+    
+    def slow_down(self, pause: float = 0):
+        """Server membatasi request (429): turunkan rate dan tunda request berikutnya"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = max(self.min_rate, self.rate / 2)
+            self.successes = 0
+            # Semua thread ikut menunggu, bukan hanya thread yang kena 429
+            self.tokens = min(self.tokens, -pause * self.rate)